@@ -1,12 +1,29 @@
+from itertools import repeat
+
+from RadixSortParaNumerosNegativos import compress_sorted, sort_keys
+
 # Clase para definir un nodo del árbol AVL
 class AVLNode:
-    def __init__(self, key):
+    sums = False                  # Los nodos sin aumentar no guardan la suma del subárbol
+    total = 0
+    count = 1                     # Copias de la clave (solo cambia en modo multiconjunto)
+
+    def __init__(self, key, value=None):
         self.key = key            # Valor o clave del nodo
+        self.value = value        # Valor asociado (para usar el árbol como mapa ordenado)
         self.left = None          # Hijo izquierdo
         self.right = None         # Hijo derecho
         self.height = 1           # Altura del nodo (inicialmente 1)
         self.size = 1             # Tamaño del subárbol (inicialmente 1)
 
+# Nodo aumentado con la suma de las claves de su subárbol (para sum_range)
+class SumAVLNode(AVLNode):
+    sums = True
+
+    def __init__(self, key, value=None):
+        super().__init__(key, value)
+        self.total = key          # Suma de las claves del subárbol
+
 # Función para obtener la altura de un nodo
 def height(node):
     return node.height if node else 0
@@ -15,11 +32,17 @@ def height(node):
 def size(node):
     return node.size if node else 0
 
-# Actualiza la altura y tamaño del nodo según sus hijos
+# Función para obtener la suma de las claves de un subárbol
+def total(node):
+    return node.total if node else 0
+
+# Actualiza la altura y tamaño (y la suma, si el nodo la guarda) según sus hijos
 def update(node):
     if node:
         node.height = 1 + max(height(node.left), height(node.right))
-        node.size = 1 + size(node.left) + size(node.right)
+        node.size = node.count + size(node.left) + size(node.right)
+        if node.sums:
+            node.total = node.key * node.count + total(node.left) + total(node.right)
 
 # Calcula el factor de balance del nodo
 def get_balance(node):
@@ -50,27 +73,34 @@ def left_rotate(x):
     return y
 
 # Inserta un nodo en el árbol AVL y reequilibra si es necesario
-def insert(node, key):
+# (node_class=SumAVLNode mantiene además las sumas de los subárboles; con
+# multiset=True una clave repetida solo incrementa el contador de su nodo)
+def insert(node, key, node_class=AVLNode, multiset=False):
     if node is None:
-        return AVLNode(key)  # Crea y retorna un nuevo nodo si no existe
+        return node_class(key)  # Crea y retorna un nuevo nodo si no existe
 
+    if multiset and key == node.key:
+        node.count += 1
+        update(node)
+        return node
     if key < node.key:
-        node.left = insert(node.left, key)  # Inserta a la izquierda
+        node.left = insert(node.left, key, node_class, multiset)  # Inserta a la izquierda
     else:
-        node.right = insert(node.right, key)  # Inserta a la derecha
+        node.right = insert(node.right, key, node_class, multiset)  # Inserta a la derecha
 
     update(node)             # Actualiza el nodo actual
     balance = get_balance(node)  # Calcula el balance
 
-    # Casos de reequilibrio:
-    if balance > 1 and key < node.left.key:
+    # Casos de reequilibrio (según el balance del hijo, así las claves repetidas
+    # que van a la derecha caen en el caso correcto):
+    if balance > 1 and get_balance(node.left) >= 0:
         return right_rotate(node)
-    if balance < -1 and key > node.right.key:
+    if balance < -1 and get_balance(node.right) <= 0:
         return left_rotate(node)
-    if balance > 1 and key > node.left.key:
+    if balance > 1 and get_balance(node.left) < 0:
         node.left = left_rotate(node.left)
         return right_rotate(node)
-    if balance < -1 and key < node.right.key:
+    if balance < -1 and get_balance(node.right) > 0:
         node.right = right_rotate(node.right)
         return left_rotate(node)
 
@@ -84,14 +114,19 @@ def min_value_node(node):
     return current
 
 # Elimina un nodo del árbol AVL y reequilibra si es necesario
-def delete(node, key):
+# (con multiset=True primero se descuenta una copia de la clave)
+def delete(node, key, multiset=False):
     if node is None:
         return node
 
     if key < node.key:
-        node.left = delete(node.left, key)  # Busca en el subárbol izquierdo
+        node.left = delete(node.left, key, multiset)  # Busca en el subárbol izquierdo
     elif key > node.key:
-        node.right = delete(node.right, key)  # Busca en el subárbol derecho
+        node.right = delete(node.right, key, multiset)  # Busca en el subárbol derecho
+    elif multiset and node.count > 1:
+        node.count -= 1
+        update(node)
+        return node
     else:
         # Nodo a eliminar encontrado
         if node.left is None:
@@ -104,7 +139,10 @@ def delete(node, key):
             return temp
         temp = min_value_node(node.right)  # Encuentra el sucesor in-order
         node.key = temp.key                 # Reemplaza la clave
-        node.right = delete(node.right, temp.key)  # Elimina el sucesor
+        node.value = temp.value
+        if temp.count != node.count:
+            node.count = temp.count
+        node.right = delete(node.right, temp.key)  # Elimina el sucesor (el nodo entero)
 
     if node is None:
         return node
@@ -135,34 +173,654 @@ def search(node, key):
     else:
         return search(node.right, key)
 
+# Recorre perezosamente las claves >= key en orden creciente (o <= key en orden
+# decreciente con reverse=True) usando una pila explícita: O(log n) para posicionarse
+# y O(1) amortizado por clave producida
+def seek(node, key, reverse=False):
+    stack = []
+    while node is not None:
+        if (node.key <= key) if reverse else (node.key >= key):
+            stack.append(node)
+            node = node.right if reverse else node.left
+        else:
+            node = node.left if reverse else node.right
+    while stack:
+        node = stack.pop()
+        yield node.key
+        if node.count > 1:
+            yield from repeat(node.key, node.count - 1)
+        node = node.left if reverse else node.right
+        while node is not None:
+            stack.append(node)
+            node = node.right if reverse else node.left
+
+# Recorre perezosamente todas las claves (en orden decreciente con reverse=True)
+def iter_inorder(node, reverse=False):
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.right if reverse else node.left
+        node = stack.pop()
+        yield node.key
+        if node.count > 1:
+            yield from repeat(node.key, node.count - 1)
+        node = node.left if reverse else node.right
+
+# Recorre perezosamente las claves dentro del rango [a, b]
+def iter_range(node, a, b, reverse=False):
+    if reverse:
+        for key in seek(node, b, reverse=True):
+            if key < a:
+                return
+            yield key
+    else:
+        for key in seek(node, a):
+            if key > b:
+                return
+            yield key
+
 # Realiza un recorrido in-order y retorna las claves en orden creciente
 def inorder(node):
-    return inorder(node.left) + [node.key] + inorder(node.right) if node else []
+    return list(iter_inorder(node))
 
 # Encuentra el k-ésimo elemento mayor usando tamaños de subárbol
 def kth_largest(node, k):
     if node is None:
         return None
     right_size = size(node.right)
-    if k == right_size + 1:
+    if right_size < k <= right_size + node.count:
         return node.key
     elif k <= right_size:
         return kth_largest(node.right, k)
     else:
-        return kth_largest(node.left, k - right_size - 1)
+        return kth_largest(node.left, k - right_size - node.count)
 
 # Retorna una lista de claves dentro del rango [a, b]
 def range_query(node, a, b):
+    return list(iter_range(node, a, b))
+
+# --- Estadísticas de orden en O(log n) usando los tamaños (y sumas) de los subárboles ---
+
+# Número de claves < key (o <= key con inclusive=True)
+def rank(node, key, inclusive=False):
+    count = 0
+    while node is not None:
+        if (node.key <= key) if inclusive else (node.key < key):
+            count += size(node.left) + node.count
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+# Encuentra el k-ésimo elemento menor (k empieza en 1)
+def kth_smallest(node, k):
+    while node is not None:
+        left_size = size(node.left)
+        if left_size < k <= left_size + node.count:
+            return node.key
+        if k <= left_size:
+            node = node.left
+        else:
+            k -= left_size + node.count
+            node = node.right
+    return None
+
+# Cuenta las claves dentro del rango [a, b] sin recorrerlas
+def count_range(node, a, b):
+    if a > b:
+        return 0
+    return rank(node, b, inclusive=True) - rank(node, a)
+
+# Suma de las claves < key (o <= key); requiere nodos SumAVLNode
+def prefix_sum(node, key, inclusive=False):
+    acc = 0
+    while node is not None:
+        if (node.key <= key) if inclusive else (node.key < key):
+            acc += total(node.left) + node.key * node.count
+            node = node.right
+        else:
+            node = node.left
+    return acc
+
+# Suma de las claves dentro del rango [a, b]; requiere nodos SumAVLNode
+def sum_range(node, a, b):
+    if a > b:
+        return 0
+    return prefix_sum(node, b, inclusive=True) - prefix_sum(node, a)
+
+# Construye en O(n) un árbol perfectamente balanceado a partir de claves ordenadas
+# (counts, si se da, tiene el número de copias de cada clave)
+def build_balanced(keys, lo=0, hi=None, node_class=AVLNode, counts=None):
+    if hi is None:
+        hi = len(keys)
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = node_class(keys[mid])
+    if counts is not None and counts[mid] > 1:
+        node.count = counts[mid]
+    node.left = build_balanced(keys, lo, mid, node_class, counts)
+    node.right = build_balanced(keys, mid + 1, hi, node_class, counts)
+    update(node)            # Alturas y tamaños sin ninguna rotación
+    return node
+
+# Retorna la raíz de un árbol AVL con las claves dadas (se ordenan si hace falta);
+# con multiset=True las claves repetidas comparten un nodo
+def from_sorted(iterable, node_class=AVLNode, multiset=False):
+    keys = sort_keys(iterable)
+    if multiset:
+        keys, counts = compress_sorted(keys)
+        return build_balanced(keys, node_class=node_class, counts=counts)
+    return build_balanced(keys, node_class=node_class)
+
+# Reequilibra un nodo cuyos hijos ya están balanceados y retorna la nueva raíz del subárbol
+def rebalance(node):
+    update(node)
+    balance = get_balance(node)
+    if balance > 1:
+        if get_balance(node.left) < 0:
+            node.left = left_rotate(node.left)
+        return right_rotate(node)
+    if balance < -1:
+        if get_balance(node.right) > 0:
+            node.right = right_rotate(node.right)
+        return left_rotate(node)
+    return node
+
+# --- Split, join y operaciones de conjuntos ---
+# Todas consumen los árboles que reciben (reutilizan sus nodos) y retornan la nueva raíz.
+
+# Une left < mid <= right usando el nodo mid como pivote: O(|altura(left) - altura(right)| + 1)
+def join_with(left, mid, right):
+    hl, hr = height(left), height(right)
+    if hl > hr + 1:
+        left.right = join_with(left.right, mid, right)   # Baja por la espina derecha
+        return rebalance(left)
+    if hr > hl + 1:
+        right.left = join_with(left, mid, right.left)    # Baja por la espina izquierda
+        return rebalance(right)
+    mid.left, mid.right = left, right
+    update(mid)
+    return mid
+
+# Quita el nodo mínimo; retorna (nueva raíz, nodo mínimo)
+def pop_min(node):
+    if node.left is None:
+        right = node.right
+        node.right = None
+        return right, node
+    node.left, minimum = pop_min(node.left)
+    return rebalance(node), minimum
+
+# Une dos árboles con todas las claves de left <= todas las de right
+def join(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    right, mid = pop_min(right)
+    return join_with(left, mid, right)
+
+# Divide en (claves < key, claves >= key); con inclusive=True en (<= key, > key)
+def split(node, key, inclusive=False):
+    if node is None:
+        return None, None
+    left, right = node.left, node.right
+    node.left = node.right = None
+    if (node.key <= key) if inclusive else (node.key < key):
+        l2, r2 = split(right, key, inclusive)
+        return join_with(left, node, l2), r2
+    l2, r2 = split(left, key, inclusive)
+    return l2, join_with(r2, node, right)
+
+# Divide en (claves < key, claves == key, claves > key)
+def split3(node, key):
+    less, rest = split(node, key)
+    equal, greater = split(rest, key, inclusive=True)
+    return less, equal, greater
+
+# Con multiset=True las copias se combinan como en Counter: la unión se queda con el
+# máximo, la intersección con el mínimo y la diferencia resta (sin bajar de cero)
+
+# Unión en O(m log(n/m + 1)): las claves de t2 iguales a una de t1 se descartan
+def union(t1, t2, multiset=False):
+    if t1 is None:
+        return t2
+    if t2 is None:
+        return t1
+    l2, equal, r2 = split3(t2, t1.key)
+    if multiset and equal is not None:
+        t1.count = max(t1.count, equal.count)
+    left, right = t1.left, t1.right
+    return join_with(union(left, l2, multiset), t1, union(right, r2, multiset))
+
+# Intersección: conserva los nodos de t1 cuya clave aparece en t2
+def intersection(t1, t2, multiset=False):
+    if t1 is None or t2 is None:
+        return None
+    l2, equal, r2 = split3(t2, t1.key)
+    left, right = t1.left, t1.right
+    l, r = intersection(left, l2, multiset), intersection(right, r2, multiset)
+    if equal is None:
+        return join(l, r)
+    if multiset:
+        t1.count = min(t1.count, equal.count)
+    return join_with(l, t1, r)
+
+# Diferencia t1 - t2
+def difference(t1, t2, multiset=False):
+    if t1 is None or t2 is None:
+        return t1
+    l1, equal, r1 = split3(t1, t2.key)
+    left, right = t2.left, t2.right
+    l, r = difference(l1, left, multiset), difference(r1, right, multiset)
+    if multiset and equal is not None and equal.count > t2.count:
+        equal.count -= t2.count
+        return join_with(l, equal, r)
+    return join(l, r)
+
+# Ejecuta op sobre dos listas ordenadas de claves y retorna la lista resultante
+# (los procesos intercambian listas de claves, mucho más baratas de serializar que nodos)
+def _set_op_keys(op, keys1, keys2, multiset=False):
+    return inorder(op(from_sorted(keys1, multiset=multiset),
+                      from_sorted(keys2, multiset=multiset), multiset))
+
+# Versión paralela: divide el problema hasta "depth" niveles en este proceso y resuelve
+# las 2**depth mitades independientes en un ProcessPoolExecutor; solo conviene con
+# entradas grandes, por el costo de enviar las claves a otros procesos
+def parallel_set_op(op, t1, t2, workers=None, depth=3, min_size=100000, multiset=False):
+    from concurrent.futures import ProcessPoolExecutor
+
+    if size(t1) + size(t2) < min_size:
+        return op(t1, t2, multiset)
+    node_class = type(t1 if t1 is not None else t2)
+
+    def plan(a, b, level):
+        if level == 0 or a is None or b is None:
+            return pool.submit(_set_op_keys, op, inorder(a), inorder(b), multiset)
+        if op is difference:
+            l1, equal, r1 = split3(a, b.key)
+            keep = None
+            if multiset and equal is not None and equal.count > b.count:
+                equal.count -= b.count
+                keep = equal
+            return (plan(l1, b.left, level - 1), keep, plan(r1, b.right, level - 1))
+        l2, equal, r2 = split3(b, a.key)
+        left, right = a.left, a.right
+        keep = a if op is union or equal is not None else None
+        if multiset and equal is not None:
+            a.count = (max if op is union else min)(a.count, equal.count)
+        return (plan(left, l2, level - 1), keep, plan(right, r2, level - 1))
+
+    def resolve(step):
+        if not isinstance(step, tuple):
+            return from_sorted(step.result(), node_class, multiset)
+        left, mid, right = step
+        left, right = resolve(left), resolve(right)
+        return join_with(left, mid, right) if mid is not None else join(left, right)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return resolve(plan(t1, t2, depth))
+
+# Árbol AVL sin recursión: baja guardando el camino en una pila y reequilibra al subir
+class AVLTree:
+    # Con sums=True cada nodo guarda la suma de su subárbol y sum_range es O(log n).
+    # Con multiset=True cada clave distinta ocupa un solo nodo con un contador de copias;
+    # los tamaños cuentan copias, así que len, rank y kth_* trabajan con multiplicidad.
+    def __init__(self, sums=False, multiset=False):
+        self.root = None
+        self.sums = sums
+        self.multiset = multiset
+        self.node_class = SumAVLNode if sums else AVLNode
+
+    # Construye el árbol en O(n) a partir de claves ordenadas
+    @classmethod
+    def from_sorted(cls, iterable, sums=False, multiset=False):
+        tree = cls(sums, multiset)
+        tree.root = from_sorted(iterable, tree.node_class, multiset)
+        return tree
+
+    def __len__(self):
+        return size(self.root)
+
+    def __contains__(self, key):
+        return self.search(key) is not None
+
+    # Reemplaza el hijo "old" del nodo path[i - 1] (o la raíz) por "new"
+    def _relink(self, path, i, old, new):
+        if i == 0:
+            self.root = new
+        elif path[i - 1].left is old:
+            path[i - 1].left = new
+        else:
+            path[i - 1].right = new
+
+    # Sube por el camino reequilibrando; se detiene cuando la altura de un subárbol no cambia
+    # (salvo con sumas o contadores, que cambian en todo el camino)
+    def _fix_path(self, path):
+        full = self.sums or self.multiset
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            new_root = rebalance(node)
+            if new_root is not node:
+                self._relink(path, i, node, new_root)
+            if new_root.height == old_height and not full:
+                break  # Los tamaños de los ancestros ya se ajustaron al bajar
+
+    # Suma delta a las sumas del camino (cuando solo cambió un contador)
+    def _add_to_totals(self, path, delta):
+        if self.sums:
+            for node in path:
+                node.total += delta
+
+    # Inserta una clave (las repetidas van a la derecha, como en insert,
+    # o incrementan el contador de su nodo en modo multiconjunto)
+    def insert(self, key):
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node.size += 1                  # Tamaño actualizado al bajar
+            if self.multiset and key == node.key:
+                node.count += 1
+                self._add_to_totals(path, key)
+                return node
+            node = node.left if key < node.key else node.right
+        new = self.node_class(key)
+        if not path:
+            self.root = new
+            return new
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new
+        else:
+            parent.right = new
+        self._fix_path(path)
+        return new
+
+    # Elimina una ocurrencia de la clave; retorna False si no existe
+    def delete(self, key):
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+        for ancestor in path:
+            ancestor.size -= 1
+        if self.multiset and node.count > 1:
+            node.count -= 1
+            node.size -= 1
+            path.append(node)
+            self._add_to_totals(path, -key)
+            return True
+        if node.left is not None and node.right is not None:
+            # Se copia la clave del sucesor in-order y se elimina el sucesor
+            path.append(node)
+            node.size -= 1
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor.size -= 1
+                successor = successor.left
+            node.key = successor.key
+            node.value = successor.value
+            if successor.count != node.count:
+                node.count = successor.count
+            node = successor
+        child = node.left if node.left is not None else node.right
+        self._relink(path, len(path), node, child)
+        self._fix_path(path)
+        return True
+
+    # Busca iterativamente un nodo con la clave dada
+    def search(self, key):
+        node = self.root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def inorder(self):
+        return inorder(self.root)
+
+    # Número de copias de la clave
+    def count(self, key):
+        node = self.search(key)
+        return node.count if node is not None else 0
+
+    def kth_largest(self, k):
+        return kth_largest(self.root, k)
+
+    def range_query(self, a, b):
+        return range_query(self.root, a, b)
+
+    def rank(self, key, inclusive=False):
+        return rank(self.root, key, inclusive)
+
+    def kth_smallest(self, k):
+        return kth_smallest(self.root, k)
+
+    def count_range(self, a, b):
+        return count_range(self.root, a, b)
+
+    def sum_range(self, a, b):
+        if not self.sums:
+            raise ValueError("sum_range needs a tree created with sums=True")
+        return sum_range(self.root, a, b)
+
+    def __iter__(self):
+        return iter_inorder(self.root)
+
+    def __reversed__(self):
+        return iter_inorder(self.root, reverse=True)
+
+    def iter_inorder(self, reverse=False):
+        return iter_inorder(self.root, reverse)
+
+    def iter_range(self, a, b, reverse=False):
+        return iter_range(self.root, a, b, reverse)
+
+    def seek(self, key, reverse=False):
+        return seek(self.root, key, reverse)
+
+    @classmethod
+    def _wrap(cls, root, sums=False, multiset=False):
+        tree = cls(sums, multiset)
+        tree.root = root
+        return tree
+
+    # Divide el árbol (que queda vacío) en (claves < key, claves >= key)
+    def split(self, key):
+        left, right = split(self.root, key)
+        self.root = None
+        return (self._wrap(left, self.sums, self.multiset),
+                self._wrap(right, self.sums, self.multiset))
+
+    # Une dos árboles con todas las claves de left <= las de right (ambos quedan vacíos)
+    @classmethod
+    def join(cls, left, right):
+        root = join(left.root, right.root)
+        left.root = right.root = None
+        return cls._wrap(root, left.sums, left.multiset)
+
+    # Operaciones de conjuntos: consumen ambos árboles y retornan uno nuevo.
+    # Con workers (o parallel=True) las mitades se resuelven en un pool de procesos.
+    # En modo multiconjunto las copias se combinan como en Counter (máx, mín, resta).
+    def _set_op(self, op, other, parallel, workers):
+        if self.multiset != other.multiset:
+            raise ValueError("set operations need both trees in the same multiset mode")
+        if parallel or workers:
+            root = parallel_set_op(op, self.root, other.root, workers, multiset=self.multiset)
+        else:
+            root = op(self.root, other.root, self.multiset)
+        self.root = other.root = None
+        return self._wrap(root, self.sums, self.multiset)
+
+    def union(self, other, parallel=False, workers=None):
+        return self._set_op(union, other, parallel, workers)
+
+    def intersection(self, other, parallel=False, workers=None):
+        return self._set_op(intersection, other, parallel, workers)
+
+    def difference(self, other, parallel=False, workers=None):
+        return self._set_op(difference, other, parallel, workers)
+
+# --- Modo persistente (copia de caminos) ---
+# Insertar o eliminar copia solo los O(log n) nodos del camino (y los que rotan) y
+# retorna una raíz nueva; el resto del árbol se comparte. Ningún nodo alcanzable desde
+# una raíz anterior se modifica, así que las versiones viejas siguen siendo válidas.
+
+# Copia superficial de un nodo (mismos hijos)
+def _clone(node):
+    copy = object.__new__(type(node))
+    copy.__dict__ = node.__dict__.copy()
+    return copy
+
+# Como rebalance, pero copia los hijos antes de rotarlos; node ya debe ser una copia
+def _rebalance_copy(node):
+    update(node)
+    balance = get_balance(node)
+    if balance > 1:
+        node.left = _clone(node.left)
+        if get_balance(node.left) < 0:
+            node.left.right = _clone(node.left.right)
+            node.left = left_rotate(node.left)
+        return right_rotate(node)
+    if balance < -1:
+        node.right = _clone(node.right)
+        if get_balance(node.right) > 0:
+            node.right.left = _clone(node.right.left)
+            node.right = right_rotate(node.right)
+        return left_rotate(node)
+    return node
+
+# Retorna la raíz de una nueva versión con la clave insertada
+def persistent_insert(node, key, node_class=AVLNode):
     if node is None:
-        return []
-    result = []
-    if a < node.key:
-        result.extend(range_query(node.left, a, b))
-    if a <= node.key <= b:
-        result.append(node.key)
-    if node.key < b:
-        result.extend(range_query(node.right, a, b))
-    return result
+        return node_class(key)
+    node = _clone(node)
+    if key < node.key:
+        node.left = persistent_insert(node.left, key, node_class)
+    else:
+        node.right = persistent_insert(node.right, key, node_class)
+    return _rebalance_copy(node)
+
+# Quita el mínimo sin modificar el subárbol original; retorna (nueva raíz, nodo mínimo)
+def _persistent_pop_min(node):
+    if node.left is None:
+        return node.right, node
+    left, minimum = _persistent_pop_min(node.left)
+    node = _clone(node)
+    node.left = left
+    return _rebalance_copy(node), minimum
+
+# Retorna la raíz de una nueva versión sin una ocurrencia de la clave
+# (la misma raíz si la clave no existe)
+def persistent_delete(node, key):
+    if node is None:
+        return None
+    if key < node.key:
+        left = persistent_delete(node.left, key)
+        if left is node.left:
+            return node          # No se encontró: no se copia nada
+        node = _clone(node)
+        node.left = left
+    elif key > node.key:
+        right = persistent_delete(node.right, key)
+        if right is node.right:
+            return node
+        node = _clone(node)
+        node.right = right
+    else:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        right, successor = _persistent_pop_min(node.right)
+        node = _clone(node)
+        node.key = successor.key
+        node.value = successor.value
+        node.right = right
+    return _rebalance_copy(node)
+
+# Árbol AVL persistente: un escritor avanza la raíz y cada snapshot() es una vista
+# inmutable en O(1) que los lectores pueden consultar sin locks
+class PersistentAVLTree:
+    def __init__(self, sums=False, root=None):
+        self.root = root
+        self.sums = sums
+        self.node_class = SumAVLNode if sums else AVLNode
+
+    @classmethod
+    def from_sorted(cls, iterable, sums=False):
+        tree = cls(sums)
+        tree.root = from_sorted(iterable, tree.node_class)
+        return tree
+
+    def insert(self, key):
+        self.root = persistent_insert(self.root, key, self.node_class)
+
+    # Retorna False si la clave no existe
+    def delete(self, key):
+        root = persistent_delete(self.root, key)
+        if root is self.root:
+            return False
+        self.root = root
+        return True
+
+    # Versión actual congelada: comparte todos los nodos, no copia nada
+    def snapshot(self):
+        return PersistentAVLTree(self.sums, self.root)
+
+    def __len__(self):
+        return size(self.root)
+
+    def __contains__(self, key):
+        return self.search(key) is not None
+
+    def search(self, key):
+        node = self.root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def inorder(self):
+        return inorder(self.root)
+
+    def kth_largest(self, k):
+        return kth_largest(self.root, k)
+
+    def kth_smallest(self, k):
+        return kth_smallest(self.root, k)
+
+    def rank(self, key, inclusive=False):
+        return rank(self.root, key, inclusive)
+
+    def count_range(self, a, b):
+        return count_range(self.root, a, b)
+
+    def sum_range(self, a, b):
+        if not self.sums:
+            raise ValueError("sum_range needs a tree created with sums=True")
+        return sum_range(self.root, a, b)
+
+    def range_query(self, a, b):
+        return range_query(self.root, a, b)
+
+    def __iter__(self):
+        return iter_inorder(self.root)
+
+    def __reversed__(self):
+        return iter_inorder(self.root, reverse=True)
+
+    def iter_range(self, a, b, reverse=False):
+        return iter_range(self.root, a, b, reverse)
+
+    def seek(self, key, reverse=False):
+        return seek(self.root, key, reverse)
 
 # Bloque principal para probar el árbol AVL
 if __name__ == "__main__":
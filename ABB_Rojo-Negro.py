@@ -1,25 +1,88 @@
+from array import array
+from itertools import repeat
+
+from RadixSortParaNumerosNegativos import compress_sorted, sort_keys
+
 RED = "RED"
 BLACK = "BLACK"
 
 # Nodo para el Árbol Rojo-Negro
 class RBNode:
-    def __init__(self, key, color=RED, left=None, right=None, parent=None, size=1):
+    # Sin __dict__ por nodo: los atributos van en espacios fijos
+    __slots__ = ("key", "color", "left", "right", "parent", "size", "value", "count")
+    sums = False                    # Sin suma del subárbol (NIL también suma 0)
+    total = 0
+
+    def __init__(self, key, color=RED, left=None, right=None, parent=None, size=1, value=None):
         self.key = key              # Clave del nodo
+        self.value = value          # Valor asociado (para usar el árbol como mapa ordenado)
         self.color = color          # Color del nodo (RED o BLACK)
         self.left = left            # Hijo izquierdo
         self.right = right          # Hijo derecho
         self.parent = parent        # Padre del nodo
-        self.size = size            # Tamaño del subárbol (número de nodos)
+        self.size = size            # Tamaño del subárbol (número de claves, con copias)
+        self.count = 1              # Copias de la clave (solo cambia en modo multiconjunto)
+
+# Nodo aumentado con la suma de las claves de su subárbol (para sum_range)
+class SumRBNode(RBNode):
+    __slots__ = ("total",)
+    sums = True
+
+    def __init__(self, key, color=RED, left=None, right=None, parent=None, size=1, value=None):
+        super().__init__(key, color, left, right, parent, size, value)
+        self.total = key            # Suma de las claves del subárbol
+
+# Nodo NIL (sentinela) compartido por todos los árboles: así split/join pueden
+# mover nodos de un árbol a otro sin reescribir sus hojas. Como lo comparten árboles
+# que pueden usarse desde hilos distintos, nunca se escribe: la eliminación lleva el
+# padre de x aparte en lugar de guardarlo en NIL.parent
+NIL = RBNode(key=None, color=BLACK, size=0)
+NIL.left = NIL
+NIL.right = NIL
+NIL.parent = NIL
 
 # Árbol Rojo-Negro
 class RedBlackTree:
-    def __init__(self):
-        # Nodo NIL (sentinela) para simplificar operaciones
-        self.NIL = RBNode(key=None, color=BLACK, size=0)
-        self.NIL.left = self.NIL
-        self.NIL.right = self.NIL
-        self.NIL.parent = self.NIL
+    # Con sums=True cada nodo guarda la suma de su subárbol y sum_range es O(log n).
+    # Con multiset=True cada clave distinta ocupa un solo nodo con un contador de copias.
+    def __init__(self, sums=False, multiset=False):
+        self.NIL = NIL              # Sentinela para simplificar operaciones
         self.root = self.NIL        # La raíz inicia como NIL
+        self.sums = sums
+        self.multiset = multiset
+        self.node_class = SumRBNode if sums else RBNode
+
+    # Construye en O(n) un árbol balanceado a partir de claves (se ordenan si hace falta).
+    # Todas las hojas quedan en las dos últimas profundidades: los nodos del nivel más
+    # profundo se pintan de rojo y el resto de negro, así la altura negra es uniforme.
+    @classmethod
+    def from_sorted(cls, iterable, sums=False, multiset=False):
+        tree = cls(sums, multiset)
+        keys = sort_keys(iterable)
+        if not keys:
+            return tree
+        counts = None
+        if multiset:
+            keys, counts = compress_sorted(keys)
+        depth = (len(keys)).bit_length() - 1   # Profundidad máxima del árbol balanceado
+        tree.root = tree._build(keys, 0, len(keys), 0, depth, tree.NIL, counts)
+        return tree
+
+    # Auxiliar de from_sorted: construye el subárbol de keys[lo:hi]
+    def _build(self, keys, lo, hi, level, depth, parent, counts=None):
+        if lo >= hi:
+            return self.NIL
+        mid = (lo + hi) // 2
+        color = RED if level == depth and level > 0 else BLACK
+        node = self.node_class(keys[mid], color, parent=parent, size=hi - lo)
+        node.left = self._build(keys, lo, mid, level + 1, depth, node, counts)
+        node.right = self._build(keys, mid + 1, hi, level + 1, depth, node, counts)
+        if counts is not None:
+            node.count = counts[mid]
+            node.size = node.left.size + node.right.size + node.count
+        if node.sums:
+            node.total = node.left.total + node.right.total + node.key * node.count
+        return node
 
     # Realiza una rotación izquierda para reequilibrar el árbol
     def left_rotate(self, x):
@@ -38,7 +101,10 @@ class RedBlackTree:
         x.parent = y                   # Actualiza el padre de x
 
         y.size = x.size                # Actualiza tamaños
-        x.size = x.left.size + x.right.size + 1
+        x.size = x.left.size + x.right.size + x.count
+        if x.sums:                     # y las sumas, si los nodos las guardan
+            y.total = x.total
+            x.total = x.left.total + x.right.total + x.key * x.count
 
     # Realiza una rotación derecha para reequilibrar el árbol
     def right_rotate(self, y):
@@ -57,27 +123,35 @@ class RedBlackTree:
         y.parent = x                   # Actualiza el padre de y
 
         x.size = y.size                # Actualiza tamaños
-        y.size = y.left.size + y.right.size + 1
+        y.size = y.left.size + y.right.size + y.count
+        if y.sums:
+            x.total = y.total
+            y.total = y.left.total + y.right.total + y.key * y.count
 
-    # Inserta una nueva clave en el árbol
+    # Inserta una nueva clave en el árbol y retorna su nodo
+    # (en modo multiconjunto una clave repetida solo incrementa el contador de su nodo)
     def insert(self, key):
-        z = RBNode(key)                # Crea el nuevo nodo
-        z.left = self.NIL             # Inicializa hijos con NIL
-        z.right = self.NIL
-        z.parent = self.NIL
-        z.color = RED                  # Nuevo nodo es rojo
-        z.size = 1
-
         y = self.NIL
         x = self.root
         while x != self.NIL:
             y = x
             x.size += 1               # Incrementa tamaño mientras recorre el árbol
+            if self.sums:
+                x.total += key
+            if self.multiset and key == x.key:
+                x.count += 1
+                return x
             if key < x.key:
                 x = x.left          # Avanza a la izquierda
             else:
                 x = x.right         # Avanza a la derecha
 
+        z = self.node_class(key)       # Crea el nuevo nodo
+        z.left = self.NIL             # Inicializa hijos con NIL
+        z.right = self.NIL
+        z.color = RED                  # Nuevo nodo es rojo
+        z.size = 1
+
         z.parent = y
         if y == self.NIL:
             self.root = z           # Si el árbol está vacío, z es la raíz
@@ -87,6 +161,7 @@ class RedBlackTree:
             y.right = z             # Inserta z a la derecha
 
         self.rb_insert_fixup(z)     # Corrige propiedades rojo-negro
+        return z
 
     # Ajusta el árbol después de la inserción para mantener sus propiedades
     def rb_insert_fixup(self, z):
@@ -119,7 +194,9 @@ class RedBlackTree:
                     z.parent.color = BLACK
                     z.parent.parent.color = RED
                     self.left_rotate(z.parent.parent)
+        grew = self.root.color == RED
         self.root.color = BLACK    # Asegura que la raíz sea negra
+        return grew                # True si la altura negra del árbol aumentó
 
     # Busca y retorna el nodo con la clave dada (o NIL si no existe)
     def search_node(self, key):
@@ -136,11 +213,79 @@ class RedBlackTree:
         node = self.search_node(key)
         return node if node != self.NIL else None
 
+    # Número de claves (con copias)
+    def __len__(self):
+        return self.root.size
+
+    # Número de copias de la clave
+    def count(self, key):
+        node = self.search_node(key)
+        return node.count if node != self.NIL else 0
+
     # Recorrido in-order auxiliar que retorna una lista de claves
     def inorder_helper(self, node):
-        if node == self.NIL:
-            return []
-        return self.inorder_helper(node.left) + [node.key] + self.inorder_helper(node.right)
+        return list(self._iter_subtree(node))
+
+    # Recorre perezosamente el subárbol con una pila explícita
+    def _iter_subtree(self, node, reverse=False):
+        stack = []
+        while stack or node != self.NIL:
+            while node != self.NIL:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            node = stack.pop()
+            yield node.key
+            if node.count > 1:
+                yield from repeat(node.key, node.count - 1)
+            node = node.left if reverse else node.right
+
+    # Recorre perezosamente todas las claves (en orden decreciente con reverse=True)
+    def iter_inorder(self, reverse=False):
+        return self._iter_subtree(self.root, reverse)
+
+    def __iter__(self):
+        return self._iter_subtree(self.root)
+
+    def __reversed__(self):
+        return self._iter_subtree(self.root, reverse=True)
+
+    # Cursor perezoso desde la primera clave >= key (o <= key hacia atrás con reverse=True)
+    def seek(self, key, reverse=False):
+        return self._seek(self.root, key, reverse)
+
+    def _seek(self, node, key, reverse=False):
+        stack = []
+        while node != self.NIL:
+            if (node.key <= key) if reverse else (node.key >= key):
+                stack.append(node)
+                node = node.right if reverse else node.left
+            else:
+                node = node.left if reverse else node.right
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.count > 1:
+                yield from repeat(node.key, node.count - 1)
+            node = node.left if reverse else node.right
+            while node != self.NIL:
+                stack.append(node)
+                node = node.right if reverse else node.left
+
+    # Recorre perezosamente las claves en [a, b]: O(log n + k) para k resultados consumidos
+    def iter_range(self, a, b, reverse=False):
+        return self._iter_range(self.root, a, b, reverse)
+
+    def _iter_range(self, node, a, b, reverse=False):
+        if reverse:
+            for key in self._seek(node, b, reverse=True):
+                if key < a:
+                    return
+                yield key
+        else:
+            for key in self._seek(node, a):
+                if key > b:
+                    return
+                yield key
 
     # Recorrido in-order del árbol completo
     def inorder(self):
@@ -160,29 +305,44 @@ class RedBlackTree:
             u.parent.left = v
         else:
             u.parent.right = v
-        v.parent = u.parent      # Actualiza el padre de v
+        if v is not self.NIL:
+            v.parent = u.parent  # Actualiza el padre de v (NIL no se toca)
 
     # Elimina el nodo con la clave dada y reequilibra el árbol
     def delete(self, key):
         z = self.search_node(key)
         if z == self.NIL:
             return             # No existe la clave, termina
+        if self.multiset and z.count > 1:
+            z.count -= 1       # Solo se descuenta una copia
+            node = z
+            while node != self.NIL:
+                node.size -= 1
+                if node.sums:
+                    node.total -= key
+                node = node.parent
+            return
+        self.delete_node(z)
 
+    # Elimina el nodo z (que pertenece al árbol) y reequilibra
+    def delete_node(self, z):
         y = z
         y_original_color = y.color
+        # x ocupa el lugar del nodo quitado y puede ser NIL: su padre se lleva en x_parent
         if z.left == self.NIL:
-            x = z.right
+            x, x_parent = z.right, z.parent
             self.rb_transplant(z, z.right)
         elif z.right == self.NIL:
-            x = z.left
+            x, x_parent = z.left, z.parent
             self.rb_transplant(z, z.left)
         else:
             y = self.minimum(z.right)
             y_original_color = y.color
             x = y.right
             if y.parent == z:
-                x.parent = y
+                x_parent = y
             else:
+                x_parent = y.parent
                 self.rb_transplant(y, y.right)
                 y.right = z.right
                 y.right.parent = y
@@ -190,75 +350,79 @@ class RedBlackTree:
             y.left = z.left
             y.left.parent = y
             y.color = z.color
-            y.size = y.left.size + y.right.size + 1
+            y.size = y.left.size + y.right.size + y.count
 
         # Actualiza el tamaño desde x hacia la raíz
-        node = x.parent
+        node = x_parent
         while node != self.NIL:
-            node.size = node.left.size + node.right.size + 1
+            node.size = node.left.size + node.right.size + node.count
+            if node.sums:
+                node.total = node.left.total + node.right.total + node.key * node.count
             node = node.parent
 
         if y_original_color == BLACK:
-            self.rb_delete_fixup(x)
+            self.rb_delete_fixup(x, x_parent)
 
     # Ajusta el árbol después de la eliminación para mantener propiedades rojo-negro
-    def rb_delete_fixup(self, x):
+    def rb_delete_fixup(self, x, x_parent):
+        p = x_parent
         while x != self.root and x.color == BLACK:
-            if x == x.parent.left:
-                w = x.parent.right
+            if x == p.left:
+                w = p.right
                 if w.color == RED:
                     w.color = BLACK
-                    x.parent.color = RED
-                    self.left_rotate(x.parent)
-                    w = x.parent.right
+                    p.color = RED
+                    self.left_rotate(p)
+                    w = p.right
                 if w.left.color == BLACK and w.right.color == BLACK:
                     w.color = RED
-                    x = x.parent
+                    x, p = p, p.parent
                 else:
                     if w.right.color == BLACK:
                         w.left.color = BLACK
                         w.color = RED
                         self.right_rotate(w)
-                        w = x.parent.right
-                    w.color = x.parent.color
-                    x.parent.color = BLACK
+                        w = p.right
+                    w.color = p.color
+                    p.color = BLACK
                     w.right.color = BLACK
-                    self.left_rotate(x.parent)
+                    self.left_rotate(p)
                     x = self.root
             else:
-                w = x.parent.left
+                w = p.left
                 if w.color == RED:
                     w.color = BLACK
-                    x.parent.color = RED
-                    self.right_rotate(x.parent)
-                    w = x.parent.left
+                    p.color = RED
+                    self.right_rotate(p)
+                    w = p.left
                 if w.right.color == BLACK and w.left.color == BLACK:
                     w.color = RED
-                    x = x.parent
+                    x, p = p, p.parent
                 else:
                     if w.left.color == BLACK:
                         w.right.color = BLACK
                         w.color = RED
                         self.left_rotate(w)
-                        w = x.parent.left
-                    w.color = x.parent.color
-                    x.parent.color = BLACK
+                        w = p.left
+                    w.color = p.color
+                    p.color = BLACK
                     w.left.color = BLACK
-                    self.right_rotate(x.parent)
+                    self.right_rotate(p)
                     x = self.root
-        x.color = BLACK
+        if x is not self.NIL:
+            x.color = BLACK
 
     # Auxiliar para obtener el k-ésimo elemento mayor usando tamaños
     def kth_largest_helper(self, node, k):
         if node == self.NIL:
             return None
         right_size = node.right.size
-        if k == right_size + 1:
+        if right_size < k <= right_size + node.count:
             return node.key
         elif k <= right_size:
             return self.kth_largest_helper(node.right, k)
         else:
-            return self.kth_largest_helper(node.left, k - right_size - 1)
+            return self.kth_largest_helper(node.left, k - right_size - node.count)
 
     # Retorna el k-ésimo elemento mayor del árbol
     def kth_largest(self, k):
@@ -266,21 +430,601 @@ class RedBlackTree:
 
     # Auxiliar para obtener las claves en el rango [a, b]
     def range_query_helper(self, node, a, b):
-        if node == self.NIL:
-            return []
-        result = []
-        if a < node.key:
-            result.extend(self.range_query_helper(node.left, a, b))
-        if a <= node.key <= b:
-            result.append(node.key)
-        if node.key < b:
-            result.extend(self.range_query_helper(node.right, a, b))
-        return result
+        return list(self._iter_range(node, a, b))
 
     # Retorna una lista de claves que se encuentran en el rango [a, b]
     def range_query(self, a, b):
         return self.range_query_helper(self.root, a, b)
 
+    # Número de claves < key (o <= key con inclusive=True) en O(log n)
+    def rank(self, key, inclusive=False):
+        count = 0
+        x = self.root
+        while x != self.NIL:
+            if (x.key <= key) if inclusive else (x.key < key):
+                count += x.left.size + x.count
+                x = x.right
+            else:
+                x = x.left
+        return count
+
+    # Retorna el k-ésimo elemento menor del árbol (k empieza en 1)
+    def kth_smallest(self, k):
+        x = self.root
+        while x != self.NIL:
+            left_size = x.left.size
+            if left_size < k <= left_size + x.count:
+                return x.key
+            if k <= left_size:
+                x = x.left
+            else:
+                k -= left_size + x.count
+                x = x.right
+        return None
+
+    # Cuenta las claves en el rango [a, b] sin recorrerlas
+    def count_range(self, a, b):
+        if a > b:
+            return 0
+        return self.rank(b, inclusive=True) - self.rank(a)
+
+    # Suma de las claves < key (o <= key) usando las sumas de los subárboles
+    def prefix_sum(self, key, inclusive=False):
+        if not self.sums:
+            raise ValueError("prefix_sum needs a tree created with sums=True")
+        acc = 0
+        x = self.root
+        while x != self.NIL:
+            if (x.key <= key) if inclusive else (x.key < key):
+                acc += x.left.total + x.key * x.count
+                x = x.right
+            else:
+                x = x.left
+        return acc
+
+    # Suma de las claves en el rango [a, b] en O(log n)
+    def sum_range(self, a, b):
+        if a > b:
+            return 0
+        return self.prefix_sum(b, inclusive=True) - self.prefix_sum(a)
+
+    # Divide el árbol (que queda vacío) en (claves < key, claves >= key)
+    def split(self, key):
+        left, _, right, _ = _split(self.root, _black_height(self.root), key)
+        self.root = self.NIL
+        return _wrap(left, self.sums, self.multiset), _wrap(right, self.sums, self.multiset)
+
+    # Une dos árboles con todas las claves de left <= las de right (ambos quedan vacíos)
+    @staticmethod
+    def join(left, right):
+        root, _ = _join(left.root, _black_height(left.root), right.root, _black_height(right.root))
+        left.root = right.root = NIL
+        return _wrap(root, left.sums, left.multiset)
+
+    # Operaciones de conjuntos en O(m log(n/m + 1)); consumen ambos árboles.
+    # En modo multiconjunto las copias se combinan como en Counter (máx, mín, resta).
+    def _set_op(self, op, other):
+        if self.multiset != other.multiset:
+            raise ValueError("set operations need both trees in the same multiset mode")
+        root, _ = op(self.root, _black_height(self.root), other.root, _black_height(other.root),
+                     self.multiset)
+        self.root = other.root = NIL
+        return _wrap(root, self.sums, self.multiset)
+
+    def union(self, other):
+        return self._set_op(_union, other)
+
+    def intersection(self, other):
+        return self._set_op(_intersection, other)
+
+    def difference(self, other):
+        return self._set_op(_difference, other)
+
+# --- Split, join y operaciones de conjuntos sobre nodos ---
+# Trabajan con pares (raíz, altura negra) y raíces siempre negras; la altura negra cuenta
+# los nodos negros desde la raíz (incluida) hasta NIL (excluido).
+
+def _black_height(node):
+    h = 0
+    while node is not NIL:
+        if node.color == BLACK:
+            h += 1
+        node = node.left
+    return h
+
+# Árbol que envuelve una raíz suelta; también sirve para usar rotaciones y fixups sobre ella
+def _wrap(root, sums=False, multiset=False):
+    tree = RedBlackTree(sums, multiset)
+    if root is not NIL:
+        root.parent = NIL
+    tree.root = root
+    return tree
+
+# Separa un hijo de su padre y lo deja como raíz negra de su propio árbol
+def _detach(node, bh):
+    if node is NIL:
+        return node, bh
+    node.parent = NIL
+    if node.color == RED:
+        node.color = BLACK
+        bh += 1
+    return node, bh
+
+# Une l < m <= r colgando m (rojo) de la espina del árbol más alto a la altura negra
+# del otro y corrigiendo con rb_insert_fixup: O(|lbh - rbh| + 1)
+def _join_with(l, lbh, m, r, rbh):
+    if lbh == rbh:
+        m.left, m.right, m.parent, m.color = l, r, NIL, BLACK
+        m.size = l.size + r.size + m.count
+        if m.sums:
+            m.total = l.total + r.total + m.key * m.count
+        if l is not NIL:
+            l.parent = m
+        if r is not NIL:
+            r.parent = m
+        return m, lbh + 1
+    if lbh > rbh:
+        tree = _wrap(l)
+        y, h = l, lbh
+        while not (y.color == BLACK and h == rbh):
+            if y.color == BLACK:
+                h -= 1
+            y.size += r.size + m.count   # m y r quedan debajo de todo el camino
+            if y.sums:
+                y.total += r.total + m.key * m.count
+            p, y = y, y.right        # y puede llegar a NIL, cuyo padre no es confiable
+        p.right = m
+        m.left, m.right = y, r
+    else:
+        tree = _wrap(r)
+        y, h = r, rbh
+        while not (y.color == BLACK and h == lbh):
+            if y.color == BLACK:
+                h -= 1
+            y.size += l.size + m.count
+            if y.sums:
+                y.total += l.total + m.key * m.count
+            p, y = y, y.left
+        p.left = m
+        m.left, m.right = l, y
+    m.parent, m.color = p, RED
+    m.size = m.left.size + m.right.size + m.count
+    if m.sums:
+        m.total = m.left.total + m.right.total + m.key * m.count
+    if m.left is not NIL:
+        m.left.parent = m
+    if m.right is not NIL:
+        m.right.parent = m
+    grew = tree.rb_insert_fixup(m)
+    return tree.root, max(lbh, rbh) + grew
+
+# Une dos árboles sin pivote: usa el mínimo de r como nodo medio
+def _join(l, lbh, r, rbh):
+    if l is NIL:
+        return r, rbh
+    if r is NIL:
+        return l, lbh
+    tree = _wrap(r)
+    m = tree.minimum(r)
+    tree.delete_node(m)
+    r = tree.root
+    if r is not NIL:
+        r.parent = NIL
+    return _join_with(l, lbh, m, r, _black_height(r))
+
+# Divide en (claves < key, claves >= key); con inclusive=True en (<= key, > key)
+def _split(node, bh, key, inclusive=False):
+    if node is NIL:
+        return NIL, 0, NIL, 0
+    l, lbh = _detach(node.left, bh - 1)
+    r, rbh = _detach(node.right, bh - 1)
+    if (node.key <= key) if inclusive else (node.key < key):
+        rl, rlbh, rr, rrbh = _split(r, rbh, key, inclusive)
+        return (*_join_with(l, lbh, node, rl, rlbh), rr, rrbh)
+    ll, llbh, lr, lrbh = _split(l, lbh, key, inclusive)
+    return (ll, llbh, *_join_with(lr, lrbh, node, r, rbh))
+
+# Divide en (claves < key, claves == key, claves > key)
+def _split3(node, bh, key):
+    less, lbh, rest, rbh = _split(node, bh, key)
+    equal, ebh, greater, gbh = _split(rest, rbh, key, inclusive=True)
+    return less, lbh, equal, ebh, greater, gbh
+
+# Con multiset=True la unión se queda con el máximo de copias, la intersección con el
+# mínimo y la diferencia las resta (sin bajar de cero)
+def _union(a, abh, b, bbh, multiset=False):
+    if a is NIL:
+        return b, bbh
+    if b is NIL:
+        return a, abh
+    l2, l2bh, equal, _, r2, r2bh = _split3(b, bbh, a.key)   # Las claves iguales de b se descartan
+    if multiset and equal is not NIL:
+        a.count = max(a.count, equal.count)
+    l1, l1bh = _detach(a.left, abh - 1)
+    r1, r1bh = _detach(a.right, abh - 1)
+    return _join_with(*_union(l1, l1bh, l2, l2bh, multiset), a,
+                      *_union(r1, r1bh, r2, r2bh, multiset))
+
+def _intersection(a, abh, b, bbh, multiset=False):
+    if a is NIL or b is NIL:
+        return NIL, 0
+    l2, l2bh, equal, _, r2, r2bh = _split3(b, bbh, a.key)
+    l1, l1bh = _detach(a.left, abh - 1)
+    r1, r1bh = _detach(a.right, abh - 1)
+    left = _intersection(l1, l1bh, l2, l2bh, multiset)
+    right = _intersection(r1, r1bh, r2, r2bh, multiset)
+    if equal is not NIL:
+        if multiset:
+            a.count = min(a.count, equal.count)
+        return _join_with(*left, a, *right)
+    return _join(*left, *right)
+
+def _difference(a, abh, b, bbh, multiset=False):
+    if a is NIL or b is NIL:
+        return a, abh
+    l1, l1bh, equal, _, r1, r1bh = _split3(a, abh, b.key)
+    l2, l2bh = _detach(b.left, bbh - 1)
+    r2, r2bh = _detach(b.right, bbh - 1)
+    left = _difference(l1, l1bh, l2, l2bh, multiset)
+    right = _difference(r1, r1bh, r2, r2bh, multiset)
+    if multiset and equal is not NIL and equal.count > b.count:
+        equal.count -= b.count
+        return _join_with(*left, equal, *right)
+    return _join(*left, *right)
+
+# Árbol Rojo-Negro compacto: los nodos son índices enteros sobre columnas paralelas
+# (estructura de arreglos). El índice 0 es el NIL, el color ocupa 1 byte y los enlaces
+# son int32. Los espacios eliminados se reutilizan mediante una lista libre encadenada
+# por la columna left.
+_BLACK, _RED = 0, 1
+
+class CompactRedBlackTree:
+    def __init__(self, typecode='q'):
+        # typecode de la columna de claves ('q' enteros de 64 bits, 'd' flotantes);
+        # None guarda claves arbitrarias en una lista
+        self.keys = array(typecode, [0]) if typecode else [None]
+        self.color = bytearray(1)          # NIL negro
+        self.left = array('i', [0])
+        self.right = array('i', [0])
+        self.parent = array('i', [0])
+        self.size = array('i', [0])
+        self.root = 0
+        self.free = 0                      # Primer espacio libre (0 = ninguno)
+
+    def __len__(self):
+        return self.size[self.root]
+
+    # Reserva un nodo rojo para la clave, reutilizando un espacio libre si lo hay.
+    # La clave se escribe antes que todo lo demás: si la columna la rechaza (1.5 con
+    # typecode 'q'), la lista libre y los arreglos quedan como estaban
+    def _new_node(self, key):
+        x = self.free
+        if x:
+            self.keys[x] = key
+            self.free = self.left[x]
+            self.color[x] = _RED
+            self.left[x] = self.right[x] = self.parent[x] = 0
+            self.size[x] = 1
+        else:
+            x = len(self.color)
+            self.keys.append(key)
+            self.color.append(_RED)
+            self.left.append(0)
+            self.right.append(0)
+            self.parent.append(0)
+            self.size.append(1)
+        return x
+
+    def _free_node(self, x):
+        self.left[x] = self.free
+        self.size[x] = 0
+        self.free = x
+
+    def left_rotate(self, x):
+        L, R, P, S = self.left, self.right, self.parent, self.size
+        y = R[x]
+        R[x] = L[y]
+        if L[y]:
+            P[L[y]] = x
+        P[y] = P[x]
+        if P[x] == 0:
+            self.root = y
+        elif x == L[P[x]]:
+            L[P[x]] = y
+        else:
+            R[P[x]] = y
+        L[y] = x
+        P[x] = y
+        S[y] = S[x]
+        S[x] = S[L[x]] + S[R[x]] + 1
+
+    def right_rotate(self, y):
+        L, R, P, S = self.left, self.right, self.parent, self.size
+        x = L[y]
+        L[y] = R[x]
+        if R[x]:
+            P[R[x]] = y
+        P[x] = P[y]
+        if P[y] == 0:
+            self.root = x
+        elif y == R[P[y]]:
+            R[P[y]] = x
+        else:
+            L[P[y]] = x
+        R[x] = y
+        P[y] = x
+        S[x] = S[y]
+        S[y] = S[L[y]] + S[R[y]] + 1
+
+    def insert(self, key):
+        keys, L, R, P, S = self.keys, self.left, self.right, self.parent, self.size
+        # Primero se baja sin modificar nada (una comparación inválida no deja tamaños
+        # a medio actualizar) y recién después se reserva el nodo
+        y = 0
+        x = self.root
+        while x:
+            y = x
+            x = L[x] if key < keys[x] else R[x]
+        z = self._new_node(key)
+        x = y
+        while x:
+            S[x] += 1
+            x = P[x]
+        P[z] = y
+        if y == 0:
+            self.root = z
+        elif key < keys[y]:
+            L[y] = z
+        else:
+            R[y] = z
+        self._insert_fixup(z)
+
+    def _insert_fixup(self, z):
+        C, L, R, P = self.color, self.left, self.right, self.parent
+        while C[P[z]] == _RED:
+            g = P[P[z]]
+            if P[z] == L[g]:
+                y = R[g]
+                if C[y] == _RED:
+                    C[P[z]] = _BLACK
+                    C[y] = _BLACK
+                    C[g] = _RED
+                    z = g
+                else:
+                    if z == R[P[z]]:
+                        z = P[z]
+                        self.left_rotate(z)
+                    C[P[z]] = _BLACK
+                    C[P[P[z]]] = _RED
+                    self.right_rotate(P[P[z]])
+            else:
+                y = L[g]
+                if C[y] == _RED:
+                    C[P[z]] = _BLACK
+                    C[y] = _BLACK
+                    C[g] = _RED
+                    z = g
+                else:
+                    if z == L[P[z]]:
+                        z = P[z]
+                        self.right_rotate(z)
+                    C[P[z]] = _BLACK
+                    C[P[P[z]]] = _RED
+                    self.left_rotate(P[P[z]])
+        C[self.root] = _BLACK
+
+    def _search_node(self, key):
+        keys, L, R = self.keys, self.left, self.right
+        x = self.root
+        while x and keys[x] != key:
+            x = L[x] if key < keys[x] else R[x]
+        return x
+
+    # Retorna el índice del nodo (siempre > 0) si se encuentra, sino None
+    def search(self, key):
+        x = self._search_node(key)
+        return x or None
+
+    def _transplant(self, u, v):
+        L, R, P = self.left, self.right, self.parent
+        if P[u] == 0:
+            self.root = v
+        elif u == L[P[u]]:
+            L[P[u]] = v
+        else:
+            R[P[u]] = v
+        P[v] = P[u]
+
+    def delete(self, key):
+        z = self._search_node(key)
+        if z == 0:
+            return
+        C, L, R, P, S = self.color, self.left, self.right, self.parent, self.size
+        y = z
+        y_original_color = C[y]
+        if L[z] == 0:
+            x = R[z]
+            self._transplant(z, R[z])
+        elif R[z] == 0:
+            x = L[z]
+            self._transplant(z, L[z])
+        else:
+            y = R[z]
+            while L[y]:
+                y = L[y]
+            y_original_color = C[y]
+            x = R[y]
+            if P[y] == z:
+                P[x] = y
+            else:
+                self._transplant(y, R[y])
+                R[y] = R[z]
+                P[R[y]] = y
+            self._transplant(z, y)
+            L[y] = L[z]
+            P[L[y]] = y
+            C[y] = C[z]
+            S[y] = S[L[y]] + S[R[y]] + 1
+
+        node = P[x]
+        while node:
+            S[node] = S[L[node]] + S[R[node]] + 1
+            node = P[node]
+
+        if y_original_color == _BLACK:
+            self._delete_fixup(x)
+        self._free_node(z)
+
+    def _delete_fixup(self, x):
+        C, L, R, P = self.color, self.left, self.right, self.parent
+        while x != self.root and C[x] == _BLACK:
+            if x == L[P[x]]:
+                w = R[P[x]]
+                if C[w] == _RED:
+                    C[w] = _BLACK
+                    C[P[x]] = _RED
+                    self.left_rotate(P[x])
+                    w = R[P[x]]
+                if C[L[w]] == _BLACK and C[R[w]] == _BLACK:
+                    C[w] = _RED
+                    x = P[x]
+                else:
+                    if C[R[w]] == _BLACK:
+                        C[L[w]] = _BLACK
+                        C[w] = _RED
+                        self.right_rotate(w)
+                        w = R[P[x]]
+                    C[w] = C[P[x]]
+                    C[P[x]] = _BLACK
+                    C[R[w]] = _BLACK
+                    self.left_rotate(P[x])
+                    x = self.root
+            else:
+                w = L[P[x]]
+                if C[w] == _RED:
+                    C[w] = _BLACK
+                    C[P[x]] = _RED
+                    self.right_rotate(P[x])
+                    w = L[P[x]]
+                if C[R[w]] == _BLACK and C[L[w]] == _BLACK:
+                    C[w] = _RED
+                    x = P[x]
+                else:
+                    if C[L[w]] == _BLACK:
+                        C[R[w]] = _BLACK
+                        C[w] = _RED
+                        self.left_rotate(w)
+                        w = L[P[x]]
+                    C[w] = C[P[x]]
+                    C[P[x]] = _BLACK
+                    C[L[w]] = _BLACK
+                    self.right_rotate(P[x])
+                    x = self.root
+        C[x] = _BLACK
+
+    def kth_largest(self, k):
+        L, R, S = self.left, self.right, self.size
+        x = self.root
+        while x:
+            right_size = S[R[x]]
+            if k == right_size + 1:
+                return self.keys[x]
+            if k <= right_size:
+                x = R[x]
+            else:
+                k -= right_size + 1
+                x = L[x]
+        return None
+
+    def kth_smallest(self, k):
+        L, R, S = self.left, self.right, self.size
+        x = self.root
+        while x:
+            left_size = S[L[x]]
+            if k == left_size + 1:
+                return self.keys[x]
+            if k <= left_size:
+                x = L[x]
+            else:
+                k -= left_size + 1
+                x = R[x]
+        return None
+
+    # Número de claves < key (o <= key con inclusive=True)
+    def rank(self, key, inclusive=False):
+        keys, L, R, S = self.keys, self.left, self.right, self.size
+        count = 0
+        x = self.root
+        while x:
+            if (keys[x] <= key) if inclusive else (keys[x] < key):
+                count += S[L[x]] + 1
+                x = R[x]
+            else:
+                x = L[x]
+        return count
+
+    def count_range(self, a, b):
+        if a > b:
+            return 0
+        return self.rank(b, inclusive=True) - self.rank(a)
+
+    # Cursor perezoso desde la primera clave >= key (o <= key hacia atrás con reverse=True)
+    def seek(self, key, reverse=False):
+        keys = self.keys
+        down, up = (self.right, self.left) if reverse else (self.left, self.right)
+        stack = []
+        x = self.root
+        while x:
+            if (keys[x] <= key) if reverse else (keys[x] >= key):
+                stack.append(x)
+                x = down[x]
+            else:
+                x = up[x]
+        while stack:
+            x = stack.pop()
+            yield keys[x]
+            x = up[x]
+            while x:
+                stack.append(x)
+                x = down[x]
+
+    def iter_inorder(self, reverse=False):
+        keys = self.keys
+        down, up = (self.right, self.left) if reverse else (self.left, self.right)
+        stack = []
+        x = self.root
+        while stack or x:
+            while x:
+                stack.append(x)
+                x = down[x]
+            x = stack.pop()
+            yield keys[x]
+            x = up[x]
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    def __reversed__(self):
+        return self.iter_inorder(reverse=True)
+
+    def iter_range(self, a, b, reverse=False):
+        if reverse:
+            for key in self.seek(b, reverse=True):
+                if key < a:
+                    return
+                yield key
+        else:
+            for key in self.seek(a):
+                if key > b:
+                    return
+                yield key
+
+    def inorder(self):
+        return list(self.iter_inorder())
+
+    def range_query(self, a, b):
+        return list(self.iter_range(a, b))
+
 # Bloque principal para probar el Árbol Rojo-Negro
 if __name__ == "__main__":
     tree = RedBlackTree()
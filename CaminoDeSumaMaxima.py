@@ -23,8 +23,9 @@ def maxPathSum(root):
     return max_sum
 
 # EJEMPLO
-root = TreeNode(10,
-                TreeNode(2, TreeNode(20), TreeNode(1)),
-                TreeNode(10, None, TreeNode(-25, TreeNode(3), TreeNode(4))))
+if __name__ == "__main__":
+    root = TreeNode(10,
+                    TreeNode(2, TreeNode(20), TreeNode(1)),
+                    TreeNode(10, None, TreeNode(-25, TreeNode(3), TreeNode(4))))
 
-print(maxPathSum(root))  # 42 (20 -> 2 -> 10 -> 10)
+    print(maxPathSum(root))  # 42 (20 -> 2 -> 10 -> 10)
@@ -1,3 +1,11 @@
+import math
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # Sin NumPy cada consulta se resuelve con bisect, una a la vez
+    np = None
+
 def findMedianSortedArrays(A, B):
     if len(A) > len(B):
         A, B = B, A
@@ -23,7 +31,114 @@ def findMedianSortedArrays(A, B):
         else:
             low = i + 1
 
+# Generalización a K arreglos ordenados sin mezclarlos. Se mantiene, para cada arreglo,
+# un intervalo [lo, hi) que contiene el corte de la respuesta; el pivote es la mediana
+# de los elementos centrales de los intervalos pesada por su largo, y contar cuántos
+# elementos son < y <= que el pivote cuesta una búsqueda binaria por arreglo, O(K log N)
+# por ronda. Cada ronda descarta al menos un cuarto de lo que queda en los intervalos
+
+# Mediana pesada: el primer candidato (en orden) en el que el peso acumulado llega a la mitad
+def _weighted_median(candidates):
+    candidates.sort()
+    total = sum(weight for _, weight in candidates)
+    acc = 0
+    for value, weight in candidates:
+        acc += weight
+        if 2 * acc >= total:
+            return value
+
+# k-ésimo menor (desde 1) con bisect; lo y hi traen cotas ya conocidas del corte y se
+# devuelven los cortes exactos de la respuesta, que sirven de cotas para la siguiente
+def _kth_python(arrays, k, lo, hi):
+    while True:
+        pivot = _weighted_median([(a[(l + h) // 2], h - l)
+                                  for a, l, h in zip(arrays, lo, hi) if h > l])
+        left = [bisect_left(a, pivot) for a in arrays]
+        right = [bisect_right(a, pivot) for a in arrays]
+        if k <= sum(left):
+            hi = [min(h, c) for h, c in zip(hi, left)]
+        elif k > sum(right):
+            lo = [max(l, c) for l, c in zip(lo, right)]
+        else:
+            return pivot, left, right
+
+# Todas las consultas avanzan juntas: en cada ronda hay un searchsorted por arreglo con
+# los pivotes de todas las consultas pendientes. Con ks ordenadas, los cortes de una
+# consulta acotan a las demás: lo sube hacia las k mayores y hi baja hacia las menores
+def _kth_numpy(arrays, ks):
+    q, sizes = len(ks), np.array([len(a) for a in arrays])
+    lo = np.zeros((q, len(arrays)), dtype=np.int64)
+    hi = np.tile(sizes, (q, 1))
+    result = np.empty(q, dtype=np.result_type(*arrays))
+    pending = np.arange(q)
+    while pending.size:
+        l, h = lo[pending], hi[pending]
+        mids = np.stack([a[np.minimum((l[:, i] + h[:, i]) // 2, len(a) - 1)]
+                         for i, a in enumerate(arrays)], axis=1)
+        order = np.argsort(mids, axis=1)
+        acc = np.cumsum(np.take_along_axis(h - l, order, axis=1), axis=1)
+        pick = np.argmax(2 * acc >= acc[:, -1:], axis=1)
+        pivots = mids[np.arange(len(pending)), order[np.arange(len(pending)), pick]]
+        left = np.stack([np.searchsorted(a, pivots, "left") for a in arrays], axis=1)
+        right = np.stack([np.searchsorted(a, pivots, "right") for a in arrays], axis=1)
+        k = ks[pending]
+        below, above = k <= left.sum(axis=1), k > right.sum(axis=1)
+        found = ~below & ~above
+        hi[pending] = np.where(below[:, None], np.minimum(h, left), h)
+        lo[pending] = np.where(above[:, None], np.maximum(l, right), l)
+        lo[pending[found]], hi[pending[found]] = left[found], right[found]
+        result[pending[found]] = pivots[found]
+        lo = np.maximum.accumulate(lo, axis=0)
+        hi = np.minimum.accumulate(hi[::-1], axis=0)[::-1]
+        pending = pending[~found]
+    return result
+
+def _nonempty(arrays):
+    if np is not None:
+        arrays = [np.asarray(a) for a in arrays]
+    return [a for a in arrays if len(a)]
+
+# Resuelve varias k de una vez, en orden creciente para reutilizar los cortes
+def _kth_many(arrays, ks):
+    n = sum(len(a) for a in arrays)
+    for k in ks:
+        if not 1 <= k <= n:
+            raise IndexError(f"k={k} out of range for {n} elements")
+    if not ks:
+        return []
+    if np is not None:
+        ks = np.asarray(ks, dtype=np.int64)
+        order = np.argsort(ks, kind="stable")
+        values = _kth_numpy(arrays, ks[order])
+        result = np.empty_like(values)
+        result[order] = values
+        return result.tolist()
+    result = [None] * len(ks)
+    lo = [0] * len(arrays)
+    for j in sorted(range(len(ks)), key=ks.__getitem__):
+        result[j], lo, _ = _kth_python(arrays, ks[j], lo, [len(a) for a in arrays])
+    return result
+
+def kth_of_sorted(arrays, k):
+    """k-ésimo menor (desde 1) de la unión de varios arreglos ordenados, sin mezclarlos."""
+    return _kth_many(_nonempty(arrays), [k])[0]
+
+def quantiles_of_sorted(arrays, qs):
+    """Cuantiles por rango más cercano (el menor elemento con al menos q * N elementos
+    <= que él, como method="inverted_cdf" de NumPy) para cada q en qs."""
+    arrays = _nonempty(arrays)
+    n = sum(len(a) for a in arrays)
+    if not n:
+        raise ValueError("quantiles of empty data")
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError(f"quantile {q} outside [0, 1]")
+    return _kth_many(arrays, [max(1, math.ceil(q * n)) for q in qs])
+
 # EJEMPLO
-arr1 = [1, 3, 8]
-arr2 = [7, 9, 10, 11]
-print(findMedianSortedArrays(arr1, arr2))  # 8
+if __name__ == "__main__":
+    arr1 = [1, 3, 8]
+    arr2 = [7, 9, 10, 11]
+    print(findMedianSortedArrays(arr1, arr2))  # 8
+    print(kth_of_sorted([arr1, arr2, [2, 5]], 4))  # 5
+    print(quantiles_of_sorted([arr1, arr2, [2, 5]], [0.5, 0.9, 0.99]))  # [7, 11, 11]
@@ -1,3 +1,8 @@
+try:
+    import numpy as np
+except ImportError:  # Sin NumPy se usa la versión en Python puro
+    np = None
+
 def counting_sort(arr, exp):
     n = len(arr)
     output = [0] * n
@@ -18,7 +23,7 @@ def counting_sort(arr, exp):
     for i in range(n):
         arr[i] = output[i]
 
-def radix_sort(arr):
+def radix_sort_python(arr):
     if not arr:
         return []
 
@@ -42,7 +47,269 @@ def radix_sort(arr):
 
     return negatives + positives
 
+# Motor LSD vectorizado sobre enteros de 64 bits: dígitos de 8 o 16 bits, signo resuelto
+# invirtiendo el bit más alto (así los negativos quedan antes sin separar la entrada),
+# dos búferes preasignados que se alternan y sin pasadas para dígitos constantes
+_SIGN_BIT = 1 << 63
+_ALL_BITS = (1 << 64) - 1
+
+def _digit_type(digit_bits):
+    if digit_bits not in (8, 16):
+        raise ValueError("digit_bits must be 8 or 16")
+    return np.uint8 if digit_bits == 8 else np.uint16
+
+# Pasadas LSD sobre claves uint64 contiguas; si se pasa order (la permutación de la
+# entrada) se reordena junto con las claves, así termina siendo el argsort estable
+def _lsd_passes(keys, digit_bits, order=None):
+    digit_type = _digit_type(digit_bits)
+    if len(keys) < 2:
+        return keys, order
+    buf = np.empty_like(keys)
+    order_buf = None if order is None else np.empty_like(order)
+    # Bits que cambian entre alguna clave y la primera: un dígito sin bits así es constante
+    varying = int(np.bitwise_or.reduce(keys ^ keys[0]))
+    per_key = 64 // digit_bits
+    mask = (1 << digit_bits) - 1
+    for d in range(per_key):
+        if not (varying >> (d * digit_bits)) & mask:
+            continue
+        digits = keys.view(digit_type)[d::per_key]   # Dígito d de cada clave, sin copiar
+        # El argsort estable de enteros de 8/16 bits es un counting sort en C: da la
+        # permutación de la pasada, que se aplica escribiendo en el otro búfer
+        step = np.argsort(digits, kind="stable")
+        np.take(keys, step, out=buf)
+        keys, buf = buf, keys
+        if order is not None:
+            np.take(order, step, out=order_buf)
+            order, order_buf = order_buf, order
+    return keys, order
+
+def radix_sort_int64(values, digit_bits=8):
+    """Devuelve un arreglo int64 nuevo con los valores ordenados (de forma estable)."""
+    _digit_type(digit_bits)
+    keys = np.array(values, dtype=np.int64).astype("<u8", copy=False)
+    if len(keys) < 2:
+        return keys.view("<i8")
+    keys ^= np.uint64(_SIGN_BIT)             # int64 -> uint64 conservando el orden
+    keys, _ = _lsd_passes(keys, digit_bits)
+    keys ^= np.uint64(_SIGN_BIT)
+    return keys.view("<i8")
+
+# Claves uint64 nuevas cuyo orden sin signo es el de los valores. Enteros: se invierte el
+# bit de signo. float64 (IEEE-754): en los negativos se invierten todos los bits (así el
+# de mayor magnitud queda primero) y en los positivos solo el de signo. Con
+# signed_zero=False, -0.0 se pasa a 0.0 para que las dos claves empaten como en ==
+def _sortable_keys(values, signed_zero=False):
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind == "f":
+        values = values.astype("<f8")
+        if not signed_zero:
+            values += 0.0                    # -0.0 + 0.0 == 0.0
+        bits = values.view("<u8")
+        negative = (bits >> np.uint64(63)).astype(bool)
+        return bits ^ np.where(negative, np.uint64(_ALL_BITS), np.uint64(_SIGN_BIT))
+    if kind == "i":
+        return values.astype("<i8").view("<u8") ^ np.uint64(_SIGN_BIT)
+    if kind in "ub":
+        return values.astype("<u8")
+    raise TypeError(f"Unsupported key dtype: {values.dtype}")
+
+# Deshace _sortable_keys para float64: las claves con el bit alto en 1 eran positivas
+def _restore_float(keys):
+    positive = (keys >> np.uint64(63)).astype(bool)
+    keys ^= np.where(positive, np.uint64(_SIGN_BIT), np.uint64(_ALL_BITS))
+    return keys.view("<f8")
+
+def radix_sort_float64(values, digit_bits=8):
+    """Devuelve un arreglo float64 ordenado; -0.0 queda antes que 0.0 y los NaN van al
+    principio (con signo) o al final (sin signo)."""
+    keys = _sortable_keys(np.asarray(values, dtype=np.float64), signed_zero=True)
+    keys, _ = _lsd_passes(keys, digit_bits)
+    return _restore_float(keys)
+
+def radix_argsort(keys, digit_bits=8):
+    """Permutación estable que ordena keys (enteros de hasta 64 bits o flotantes)."""
+    keys = _sortable_keys(keys)
+    order = np.arange(len(keys), dtype=np.intp)
+    _, order = _lsd_passes(keys, digit_bits, order)
+    return order
+
+# Ordena registros guardados como columnas: las claves y cada payload son arreglos
+# paralelos, así que no se arma una tupla por registro
+def radix_sort_by_key(keys, *payloads, digit_bits=8):
+    """Devuelve (claves ordenadas, payloads reordenados...) con orden estable."""
+    keys = np.asarray(keys)
+    payloads = [np.asarray(payload) for payload in payloads]
+    if any(len(payload) != len(keys) for payload in payloads):
+        raise ValueError("payloads must have the same length as keys")
+    order = radix_argsort(keys, digit_bits)
+    return (keys[order], *(payload[order] for payload in payloads))
+
+# Orden por varias claves encadenando argsorts estables desde la menos significativa:
+# cada pasada respeta el orden que dejaron las anteriores entre claves iguales
+def radix_lexsort(columns, digit_bits=8):
+    """Permutación que ordena por columns[0], desempata por columns[1], y así."""
+    if not columns:
+        raise ValueError("at least one key column is required")
+    order = None
+    for column in reversed(columns):
+        column = np.asarray(column)
+        if order is None:
+            order = radix_argsort(column, digit_bits)
+        else:
+            order = order[radix_argsort(column[order], digit_bits)]
+    return order
+
+# Trabajo de un proceso: ordena en sitio el tramo [lo, hi) del arreglo en memoria compartida
+def _sort_shared_range(name, n, lo, hi, digit_bits):
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = np.ndarray((n,), dtype="<i8", buffer=shm.buf)
+        data[lo:hi] = radix_sort_int64(data[lo:hi], digit_bits)
+        del data  # Soltar la vista antes de cerrar el segmento
+    finally:
+        shm.close()
+
+# Versión paralela: una pasada MSD sobre los bits más altos que varían reparte las claves
+# en 2**top_bits cubetas dentro de un segmento de memoria compartida; cada proceso ordena
+# con el motor LSD un grupo de cubetas consecutivas en su lugar, sin serializar datos,
+# así que al terminar el segmento ya está ordenado y no hay que concatenar nada
+def parallel_radix_sort(values, workers=None, top_bits=8, digit_bits=8, min_size=1 << 20):
+    """Devuelve un arreglo int64 ordenado; por debajo de min_size ordena en este proceso."""
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    keys = np.asarray(values, dtype=np.int64)
+    n = len(keys)
+    workers = workers or os.cpu_count() or 1
+    if n < min_size or workers == 1:
+        return radix_sort_int64(keys, digit_bits)
+    flipped = keys.astype("<u8") ^ np.uint64(_SIGN_BIT)
+    varying = int(np.bitwise_or.reduce(flipped ^ flipped[0])).bit_length()
+    if varying == 0:
+        return keys.copy()  # Todas las claves son iguales
+    shift = max(0, varying - top_bits)
+    buckets = ((flipped >> np.uint64(shift)) & np.uint64((1 << top_bits) - 1)).astype(np.uint16)
+    del flipped
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(buckets, minlength=1 << top_bits))))
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        out = np.ndarray((n,), dtype="<i8", buffer=shm.buf)
+        np.take(keys, np.argsort(buckets, kind="stable"), out=out)   # Pasada MSD
+        del buckets
+        # Se agrupan cubetas consecutivas en unas 4 tareas por proceso de tamaño parecido
+        target = n / (workers * 4)
+        ranges, lo = [], 0
+        for hi in bounds[1:]:
+            if hi - lo >= target or hi == n:
+                if hi > lo:
+                    ranges.append((lo, int(hi)))
+                lo = int(hi)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_sort_shared_range, shm.name, n, lo, hi, digit_bits)
+                       for lo, hi in ranges]
+            for future in futures:
+                future.result()
+        result = out.copy()
+        del out
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+# El motor de NumPy convierte a int64 sin avisar (1.5 -> 1, "3" -> 3): solo se usa si
+# todos los elementos son enteros; el resto va a la versión en Python puro, que con
+# flotantes o cadenas lanza TypeError como antes
+def _engine_accepts(arr):
+    if isinstance(arr, np.ndarray):
+        kind = arr.dtype.kind
+        return kind == "i" or (kind == "u" and int(arr.max()) < _SIGN_BIT)
+    return all(type(num) is int for num in arr)
+
+# Ordena una lista de enteros: usa el motor de NumPy si está disponible y los valores
+# caben en 64 bits, si no la versión en Python puro (workers > 1 usa la versión paralela)
+def radix_sort(arr, workers=None):
+    if len(arr) == 0:
+        return []
+    if np is not None and _engine_accepts(arr):
+        try:
+            if workers and workers > 1:
+                return parallel_radix_sort(arr, workers).tolist()
+            return radix_sort_int64(arr).tolist()
+        except OverflowError:
+            pass
+    if np is not None and isinstance(arr, np.ndarray):
+        arr = arr.tolist()
+    return radix_sort_python(arr)
+
+# Mide la aceleración de parallel_radix_sort frente al motor de un solo proceso
+def benchmark_parallel(sizes=(10 ** 5, 10 ** 6, 10 ** 7), worker_counts=(1, 2, 4, 8, 16, 32)):
+    """Imprime tiempos y aceleración por tamaño y número de procesos, y el tamaño mínimo
+    a partir del cual cada número de procesos gana."""
+    import os
+    import time
+
+    rng = np.random.default_rng(22)
+    pays_off = {}
+    print(f"CPUs: {os.cpu_count()}")
+    for n in sizes:
+        data = rng.integers(-(1 << 62), 1 << 62, n, dtype=np.int64)
+        start = time.perf_counter()
+        radix_sort_int64(data)
+        serial = time.perf_counter() - start
+        print(f"n={n:<10} serial {serial:.3f}s")
+        for workers in worker_counts:
+            if workers == 1:
+                continue
+            start = time.perf_counter()
+            parallel_radix_sort(data, workers, min_size=0)
+            elapsed = time.perf_counter() - start
+            print(f"n={n:<10} workers={workers:<3} {elapsed:.3f}s  x{serial / elapsed:.2f}")
+            if elapsed < serial:
+                pays_off.setdefault(workers, n)
+    for workers in worker_counts:
+        if workers > 1:
+            print(f"workers={workers:<3} pays off from n={pays_off.get(workers, 'never (in tested sizes)')}")
+
+# Ordena claves para construir estructuras: radix_sort si son enteros, sorted() si no
+def sort_keys(keys):
+    keys = list(keys)
+    if all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1)):
+        return keys  # Ya vienen ordenadas
+    if all(type(key) is int for key in keys):
+        return radix_sort(keys)
+    if np is not None and all(type(key) is float for key in keys):
+        return radix_sort_float64(keys).tolist()
+    return sorted(keys)
+
+# Agrupa claves ordenadas en (claves distintas, copias de cada una)
+def compress_sorted(keys):
+    distinct, counts = [], []
+    for key in keys:
+        if distinct and distinct[-1] == key:
+            counts[-1] += 1
+        else:
+            distinct.append(key)
+            counts.append(1)
+    return distinct, counts
+
 # EJEMPLO
-arr = [170, -45, 75, -90, 802, 24, 2, 66, -123]
-sorted_arr = radix_sort(arr)
-print(sorted_arr)  # [-123, -90, -45, 2, 24, 66, 75, 170, 802]
+if __name__ == "__main__":
+    import sys
+
+    arr = [170, -45, 75, -90, 802, 24, 2, 66, -123]
+    sorted_arr = radix_sort(arr)
+    print(sorted_arr)  # [-123, -90, -45, 2, 24, 66, 75, 170, 802]
+
+    if np is not None:
+        print(radix_sort_float64([2.5, -0.5, -3.25, 0.0, 1e-9]).tolist())  # [-3.25, -0.5, 0.0, 1e-09, 2.5]
+        ids, names = radix_sort_by_key([3, -1, 3, 0], np.array(["c", "a", "d", "b"]))
+        print(ids.tolist(), names.tolist())  # [-1, 0, 3, 3] ['a', 'b', 'c', 'd']
+
+    if "--benchmark" in sys.argv and np is not None:
+        benchmark_parallel()
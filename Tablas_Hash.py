@@ -1,6 +1,92 @@
 import time
 import random
 import string
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los índices se calculan clave por clave
+    np = None
+
+# Para enteros con |n| < 2**61 - 1, hash(n) == n (salvo hash(-1) == -2)
+_INT_HASH_LIMIT = (1 << 61) - 1
+
+# Calcula de una vez los índices de cubeta de un lote de claves
+def bucket_plan(keys, size):
+    """Devuelve (claves, índices, orden) con el orden agrupando las operaciones por cubeta."""
+    if np is not None and len(keys) > 0:
+        try:
+            arr = np.asarray(keys)
+        except (OverflowError, ValueError):
+            arr = None
+        if (arr is not None and arr.ndim == 1 and arr.dtype.kind == 'i'
+                and arr.min() > -_INT_HASH_LIMIT and arr.max() < _INT_HASH_LIMIT):
+            indices = np.where(arr == -1, -2, arr) % size
+            # argsort estable: agrupa por cubeta sin alterar el orden dentro de cada una
+            order = np.argsort(indices, kind='stable').tolist()
+            return arr.tolist(), indices.tolist(), order
+    keys = list(keys)
+    return keys, [hash(key) % size for key in keys], range(len(keys))
+
+# Las estadísticas se calculan a partir de la estructura al pedirlas, así que no
+# agregan ningún costo a insert/search/delete
+def chain_stats(buckets):
+    """Factor de carga, histograma de largos de cadena y sondeos de una tabla encadenada."""
+    histogram = {}
+    count = 0
+    hit_probes = 0
+    for bucket in buckets:
+        length = len(bucket)
+        histogram[length] = histogram.get(length, 0) + 1
+        count += length
+        hit_probes += length * (length + 1) // 2  # El i-ésimo elemento se encuentra en i comparaciones
+    size = len(buckets)
+    longest = max(histogram, default=0)
+    return {
+        "size": size,
+        "count": count,
+        "load_factor": count / size,
+        "chain_histogram": dict(sorted(histogram.items())),
+        "avg_probe_hit": hit_probes / count if count else 0.0,
+        "max_probe_hit": longest,
+        "avg_probe_miss": count / size,  # Una búsqueda fallida recorre toda la cadena
+        "max_probe_miss": longest,
+    }
+
+def cluster_histogram(empty):
+    """Histograma de largos de tramos ocupados en un arreglo circular (empty[i] indica vacío)."""
+    clusters = {}
+    if all(empty) or not any(empty):
+        return clusters
+    # Se empieza después de un espacio vacío para no partir un cluster que da la vuelta
+    start = empty.index(True)
+    size = len(empty)
+    run = 0
+    for step in range(1, size + 1):
+        if empty[(start + step) % size]:
+            if run:
+                clusters[run] = clusters.get(run, 0) + 1
+            run = 0
+        else:
+            run += 1
+    return clusters
+
+def format_stats(stats):
+    """Resume las estadísticas en unas pocas líneas legibles."""
+    def histogram(h, limit=12):
+        items = [f"{k}:{v}" for k, v in list(h.items())[:limit]]
+        return " ".join(items) + (" ..." if len(h) > limit else "")
+
+    lines = [f"Load Factor: {stats['load_factor']:.3f}, "
+             f"Avg Probes (hit/miss): {stats['avg_probe_hit']:.2f}/{stats['avg_probe_miss']:.2f}, "
+             f"Max Probes (hit/miss): {stats['max_probe_hit']}/{stats['max_probe_miss']}, "
+             f"Resizes: {stats.get('resizes', 0)}"]
+    if "chain_histogram" in stats:
+        lines.append("Chain Lengths: " + histogram(stats["chain_histogram"]))
+    if "cluster_histogram" in stats:
+        tombstones = f" (tombstones: {stats['tombstones']})" if "tombstones" in stats else ""
+        lines.append("Cluster Sizes: " + histogram(stats["cluster_histogram"]) + tombstones)
+    return "\n".join(lines)
 
 # Implementación de tabla hash con Encadenamiento (Chaining)
 class ChainingHashTable:
@@ -41,54 +127,443 @@ class ChainingHashTable:
                 return True
         return False  # Retorna False si no se encontró
 
+    def insert_many(self, keys, values):
+        """Inserta un lote de pares calculando todos los índices por adelantado."""
+        keys, indices, order = bucket_plan(keys, self.size)
+        values = list(values)
+        table = self.table
+        for p in order:
+            key = keys[p]
+            bucket = table[indices[p]]
+            for pair in bucket:
+                if pair[0] == key:
+                    pair[1] = values[p]
+                    break
+            else:
+                bucket.append([key, values[p]])
+
+    def search_many(self, keys):
+        """Busca un lote de claves y devuelve sus valores en el mismo orden."""
+        keys, indices, order = bucket_plan(keys, self.size)
+        results = [None] * len(keys)
+        table = self.table
+        for p in order:
+            key = keys[p]
+            for pair in table[indices[p]]:
+                if pair[0] == key:
+                    results[p] = pair[1]
+                    break
+        return results
+
+    def delete_many(self, keys):
+        """Elimina un lote de claves; devuelve para cada una si se eliminó."""
+        keys, indices, order = bucket_plan(keys, self.size)
+        results = [False] * len(keys)
+        table = self.table
+        for p in order:
+            key = keys[p]
+            bucket = table[indices[p]]
+            for i, pair in enumerate(bucket):
+                if pair[0] == key:
+                    del bucket[i]
+                    results[p] = True
+                    break
+        return results
+
+    def items(self):
+        """Recorre los pares (clave, valor) almacenados."""
+        for bucket in self.table:
+            for key, value in bucket:
+                yield key, value
+
+    def stats(self):
+        """Estadísticas de colisiones calculadas bajo demanda."""
+        stats = chain_stats(self.table)
+        stats["resizes"] = 0  # Tamaño fijo
+        return stats
+
+# Marca de borrado (tombstone): mantiene intactas las cadenas de sondeo lineal
+_TOMBSTONE = object()
+
 # Implementación de tabla hash con Direccionamiento Abierto (Open Addressing)
 class OpenAddressingHashTable:
-    def __init__(self, size=10007):
+    # Número mínimo de cubetas que se migran en cada operación durante un rehash
+    REHASH_STEP = 8
+
+    def __init__(self, size=10007, max_load=0.7, min_load=0.1):
         """Inicializa la tabla con espacios vacíos (None)."""
         self.size = size
         self.table = [None] * size
-    
+        self.min_size = size          # La tabla nunca se encoge por debajo del tamaño inicial
+        self.max_load = max_load      # Factor de carga que dispara el crecimiento
+        self.min_load = min_load      # Factor de carga que dispara el encogimiento
+        self.count = 0                # Claves vivas (en ambas tablas durante un rehash)
+        self.used = 0                 # Espacios ocupados en self.table (claves + tombstones)
+        self.resizes = 0              # Número de rehash iniciados
+        # Estado del rehash incremental: tabla anterior y siguiente cubeta a migrar
+        self._old_table = None
+        self._old_size = 0
+        self._migrate_pos = 0
+        self._migrate_step = self.REHASH_STEP
+
     def _hash(self, key):
         """Calcula el índice hash de la clave."""
         return hash(key) % self.size
-    
+
+    def _find(self, table, size, key, index=None):
+        """Devuelve el índice de la clave en la tabla dada, o -1 si no está."""
+        if index is None:
+            index = hash(key) % size
+        while True:
+            entry = table[index]
+            if entry is None:
+                return -1
+            if entry is not _TOMBSTONE and entry[0] == key:
+                return index
+            index = (index + 1) % size  # Sondeo lineal
+
+    def _resize(self, new_size):
+        """Inicia un rehash incremental hacia una tabla de new_size espacios."""
+        if self._old_table is not None:
+            self._finish_rehash()
+        self._old_table = self.table
+        self._old_size = self.size
+        self._migrate_pos = 0
+        # Al encoger se migra más rápido para no llenar la tabla nueva antes de terminar
+        self._migrate_step = max(self.REHASH_STEP, -(-4 * self.size // new_size))
+        self.table = [None] * new_size
+        self.size = new_size
+        self.used = 0
+        self.resizes += 1
+
+    def _target_size(self):
+        """Tamaño que deja la tabla a la mitad del factor de carga máximo."""
+        return max(self.min_size, int(self.count / (self.max_load / 2)) + 1)
+
+    def _rehash_step(self, buckets=None):
+        """Migra algunas cubetas de la tabla anterior a la nueva."""
+        old = self._old_table
+        if old is None:
+            return
+        table, size = self.table, self.size
+        stop = min(self._old_size, self._migrate_pos + (buckets or self._migrate_step))
+        for i in range(self._migrate_pos, stop):
+            entry = old[i]
+            if entry is not None and entry is not _TOMBSTONE:
+                index = hash(entry[0]) % size
+                while table[index] is not None:
+                    index = (index + 1) % size
+                table[index] = entry
+                self.used += 1
+                # Tombstone y no None: las cadenas que aún quedan en la tabla anterior siguen válidas
+                old[i] = _TOMBSTONE
+        self._migrate_pos = stop
+        if stop == self._old_size:
+            self._old_table = None
+            self._old_size = 0
+
+    def _finish_rehash(self):
+        """Completa de una vez el rehash pendiente."""
+        if self._old_table is not None:
+            self._rehash_step(self._old_size)
+
+    def _check_load(self):
+        """Crece, encoge o limpia tombstones según el factor de carga."""
+        if self.used > self.max_load * self.size:
+            if self._old_table is not None:
+                # La tabla nueva se llenó antes de terminar: se completa la migración
+                self._finish_rehash()
+            self._resize(self._target_size())
+        elif (self._old_table is None and self.size > self.min_size
+              and self.count < self.min_load * self.size):
+            self._resize(self._target_size())
+
     def insert(self, key, value):
         """Inserta un par clave-valor usando sondeo lineal para manejar colisiones."""
-        index = self._hash(key)
-        original_index = index  # Guarda el índice original para detectar ciclos
+        self._rehash_step()
+        if self._old_table is not None:
+            # Si la clave sigue en la tabla anterior, se retira de allí
+            old_index = self._find(self._old_table, self._old_size, key)
+            if old_index >= 0:
+                self._old_table[old_index] = _TOMBSTONE
+                self.count -= 1
+        self._store(key, value, self._hash(key))
+        self._check_load()
+
+    def _store(self, key, value, index):
+        """Guarda el par en self.table sondeando desde index, reutilizando tombstones."""
+        first_free = -1  # Primer tombstone encontrado, reutilizable
         while self.table[index] is not None:
-            if self.table[index][0] == key:  # Si la clave ya existe, se actualiza
+            entry = self.table[index]
+            if entry is _TOMBSTONE:
+                if first_free < 0:
+                    first_free = index
+            elif entry[0] == key:  # Si la clave ya existe, se actualiza
                 self.table[index] = (key, value)
                 return
             index = (index + 1) % self.size  # Sondeo lineal
-            if index == original_index:
-                raise Exception("Hash table is full")  # La tabla está llena
+        if first_free >= 0:
+            index = first_free
+        else:
+            self.used += 1
         self.table[index] = (key, value)
-    
+        self.count += 1
+
     def search(self, key):
         """Busca una clave y devuelve su valor si existe, o None si no está."""
-        index = self._hash(key)
-        original_index = index
-        while self.table[index] is not None:
-            if self.table[index][0] == key:
-                return self.table[index][1]  # Retorna el valor si lo encuentra
-            index = (index + 1) % self.size  # Sondeo lineal
-            if index == original_index:
-                break
+        self._rehash_step()
+        index = self._find(self.table, self.size, key)
+        if index >= 0:
+            return self.table[index][1]  # Retorna el valor si lo encuentra
+        if self._old_table is not None:
+            index = self._find(self._old_table, self._old_size, key)
+            if index >= 0:
+                return self._old_table[index][1]
         return None
-    
+
     def delete(self, key):
-        """Elimina una clave si existe, marcando el espacio como vacío."""
-        index = self._hash(key)
-        original_index = index
-        while self.table[index] is not None:
-            if self.table[index][0] == key:
-                self.table[index] = None  # Se elimina la clave
-                return True
-            index = (index + 1) % self.size
-            if index == original_index:
-                break
-        return False
+        """Elimina una clave si existe, dejando un tombstone en su lugar."""
+        self._rehash_step()
+        index = self._find(self.table, self.size, key)
+        if index >= 0:
+            self.table[index] = _TOMBSTONE  # Se elimina la clave sin cortar la cadena
+        elif self._old_table is not None:
+            index = self._find(self._old_table, self._old_size, key)
+            if index < 0:
+                return False
+            self._old_table[index] = _TOMBSTONE
+        else:
+            return False
+        self.count -= 1
+        self._check_load()
+        return True
+
+    def insert_many(self, keys, values):
+        """Inserta un lote de pares con un único redimensionamiento previo."""
+        self._finish_rehash()
+        values = list(values)
+        needed = self.count + len(keys)
+        if self.used + len(keys) > self.max_load * self.size:
+            # Se dimensiona una sola vez para todo el lote en lugar de crecer varias veces
+            self._resize(max(self.min_size, int(needed / (self.max_load / 2)) + 1))
+            self._finish_rehash()
+        keys, indices, order = bucket_plan(keys, self.size)
+        for p in order:
+            self._store(keys[p], values[p], indices[p])
+        self._check_load()
+
+    def search_many(self, keys):
+        """Busca un lote de claves y devuelve sus valores en el mismo orden."""
+        self._finish_rehash()
+        keys, indices, order = bucket_plan(keys, self.size)
+        results = [None] * len(keys)
+        table, size = self.table, self.size
+        for p in order:
+            index = self._find(table, size, keys[p], indices[p])
+            if index >= 0:
+                results[p] = table[index][1]
+        return results
+
+    def delete_many(self, keys):
+        """Elimina un lote de claves; devuelve para cada una si se eliminó."""
+        self._finish_rehash()
+        keys, indices, order = bucket_plan(keys, self.size)
+        results = [False] * len(keys)
+        table, size = self.table, self.size
+        for p in order:
+            index = self._find(table, size, keys[p], indices[p])
+            if index >= 0:
+                table[index] = _TOMBSTONE
+                self.count -= 1
+                results[p] = True
+        self._check_load()
+        return results
+
+    def items(self):
+        """Recorre los pares (clave, valor) de ambas tablas, saltando tombstones."""
+        for table in (self.table, self._old_table or ()):
+            for entry in table:
+                if entry is not None and entry is not _TOMBSTONE:
+                    yield entry
+
+    def stats(self):
+        """Estadísticas de sondeo y de clusters de la tabla actual, calculadas bajo demanda."""
+        table, size = self.table, self.size
+        count = tombstones = hit_total = hit_max = 0
+        for i, entry in enumerate(table):
+            if entry is None:
+                continue
+            if entry is _TOMBSTONE:
+                tombstones += 1
+                continue
+            count += 1
+            probes = (i - hash(entry[0]) % size) % size + 1
+            hit_total += probes
+            hit_max = max(hit_max, probes)
+        # Los tombstones también forman parte de los clusters: los fallos los recorren
+        clusters = cluster_histogram([entry is None for entry in table])
+        # Un fallo que empieza a j posiciones del final de un cluster hace j + 1 sondeos
+        miss_total = size - sum(length * n for length, n in clusters.items())
+        miss_total += sum((length * (length + 1) // 2 + length) * n for length, n in clusters.items())
+        return {
+            "size": size,
+            "count": count,
+            "load_factor": count / size,
+            "tombstones": tombstones,
+            "cluster_histogram": dict(sorted(clusters.items())),
+            "avg_probe_hit": hit_total / count if count else 0.0,
+            "max_probe_hit": hit_max,
+            "avg_probe_miss": miss_total / size,
+            "max_probe_miss": max(clusters, default=0) + 1,
+            "resizes": self.resizes,
+            "rehash_pending": self._old_table is not None,
+        }
+
+# Máscara que deja el hash en 63 bits no negativos; -1 marca un espacio vacío
+_HASH_MASK = (1 << 63) - 1
+
+# Implementación de tabla hash Robin Hood con arreglos paralelos
+class RobinHoodHashTable:
+    def __init__(self, size=10007, max_load=0.9):
+        """Inicializa los arreglos de hashes, claves y valores (capacidad potencia de 2)."""
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        self.min_size = capacity
+        self.max_load = max_load
+        self.count = 0
+        self.resizes = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Reserva arreglos vacíos para la capacidad dada."""
+        self.size = capacity
+        self.mask = capacity - 1
+        self.hashes = array('q', [-1]) * capacity  # Hash cacheado de cada espacio
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+
+    def _resize(self, capacity):
+        """Reconstruye la tabla con otra capacidad reinsertando cada par."""
+        hashes, keys, values = self.hashes, self.keys, self.values
+        self._allocate(capacity)
+        self.resizes += 1
+        self.count = 0
+        for i in range(len(hashes)):
+            if hashes[i] >= 0:
+                self._place(hashes[i], keys[i], values[i])
+
+    def _place(self, h, key, value):
+        """Coloca una clave que se sabe ausente, desplazando a las más cercanas a su origen."""
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        index = h & mask
+        dist = 0
+        while True:
+            current = hashes[index]
+            if current < 0:
+                hashes[index] = h
+                keys[index] = key
+                values[index] = value
+                self.count += 1
+                return
+            current_dist = (index - current) & mask
+            if current_dist < dist:
+                # Robin Hood: el que está más cerca de su origen cede el lugar
+                hashes[index], h = h, current
+                keys[index], key = key, keys[index]
+                values[index], value = value, values[index]
+                dist = current_dist
+            index = (index + 1) & mask
+            dist += 1
+
+    def _find(self, key, h):
+        """Devuelve el índice de la clave, o -1 si no está."""
+        hashes, keys, mask = self.hashes, self.keys, self.mask
+        index = h & mask
+        dist = 0
+        while True:
+            current = hashes[index]
+            # Un espacio vacío o más cercano a su origen que nosotros termina la búsqueda
+            if current < 0 or ((index - current) & mask) < dist:
+                return -1
+            if current == h and keys[index] == key:
+                return index
+            index = (index + 1) & mask
+            dist += 1
+
+    def insert(self, key, value):
+        """Inserta un par clave-valor usando desplazamiento Robin Hood."""
+        h = hash(key) & _HASH_MASK
+        index = self._find(key, h)
+        if index >= 0:
+            self.values[index] = value  # Si la clave ya existe, se actualiza
+            return
+        if self.count + 1 > self.max_load * self.size:
+            self._resize(self.size * 2)
+        self._place(h, key, value)
+
+    def search(self, key):
+        """Busca una clave y devuelve su valor si existe, o None si no está."""
+        index = self._find(key, hash(key) & _HASH_MASK)
+        return self.values[index] if index >= 0 else None
+
+    def delete(self, key):
+        """Elimina una clave desplazando hacia atrás a sus sucesores (sin tombstones)."""
+        index = self._find(key, hash(key) & _HASH_MASK)
+        if index < 0:
+            return False
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        following = (index + 1) & mask
+        while hashes[following] >= 0 and (following - hashes[following]) & mask:
+            hashes[index] = hashes[following]
+            keys[index] = keys[following]
+            values[index] = values[following]
+            index = following
+            following = (following + 1) & mask
+        hashes[index] = -1
+        keys[index] = None
+        values[index] = None
+        self.count -= 1
+        if self.size > self.min_size and self.count < self.size // 8:
+            self._resize(self.size // 2)
+        return True
+
+    def items(self):
+        """Recorre los pares (clave, valor) almacenados."""
+        for i in range(self.size):
+            if self.hashes[i] >= 0:
+                yield self.keys[i], self.values[i]
+
+    def stats(self):
+        """Distancias de sondeo y clusters calculados bajo demanda."""
+        hashes, mask, size = self.hashes, self.mask, self.size
+        hit_total = hit_max = 0
+        for i in range(size):
+            if hashes[i] >= 0:
+                probes = ((i - hashes[i]) & mask) + 1
+                hit_total += probes
+                hit_max = max(hit_max, probes)
+        clusters = cluster_histogram([h < 0 for h in hashes])
+        # Un fallo se detiene en un espacio vacío o en una entrada más cercana a su origen
+        miss_total = miss_max = 0
+        for home in range(size):
+            index, dist = home, 0
+            while hashes[index] >= 0 and ((index - hashes[index]) & mask) >= dist:
+                index = (index + 1) & mask
+                dist += 1
+            miss_total += dist + 1
+            miss_max = max(miss_max, dist + 1)
+        return {
+            "size": size,
+            "count": self.count,
+            "load_factor": self.count / size,
+            "cluster_histogram": dict(sorted(clusters.items())),
+            "avg_probe_hit": hit_total / self.count if self.count else 0.0,
+            "max_probe_hit": hit_max,
+            "avg_probe_miss": miss_total / size,
+            "max_probe_miss": miss_max,
+            "resizes": self.resizes,
+        }
 
 # Función para generar claves aleatorias
 def generate_random_key(length=8):
@@ -96,7 +571,7 @@ def generate_random_key(length=8):
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
 # Función para medir rendimiento de inserción, búsqueda y eliminación
-def benchmark(hash_table_class, num_elements=10000):
+def benchmark(hash_table_class, num_elements=10000, show_stats=True):
     hash_table = hash_table_class()
     keys = [generate_random_key() for _ in range(num_elements)]
     values = [random.randint(1, 100000) for _ in range(num_elements)]
@@ -106,6 +581,8 @@ def benchmark(hash_table_class, num_elements=10000):
     for i in range(num_elements):
         hash_table.insert(keys[i], values[i])
     insertion_time = time.time() - start_time
+    if show_stats:
+        print(format_stats(hash_table.stats()))
     
     # Medir tiempo de búsqueda
     start_time = time.time()
@@ -128,3 +605,7 @@ if __name__ == "__main__":
     print("\nOpen Addressing Hash Table")
     open_times = benchmark(OpenAddressingHashTable)
     print(f"Insertion Time: {open_times[0]:.4f}s, Search Time: {open_times[1]:.4f}s, Deletion Time: {open_times[2]:.4f}s")
+
+    print("\nRobin Hood Hash Table")
+    robin_times = benchmark(RobinHoodHashTable)
+    print(f"Insertion Time: {robin_times[0]:.4f}s, Search Time: {robin_times[1]:.4f}s, Deletion Time: {robin_times[2]:.4f}s")
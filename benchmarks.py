@@ -0,0 +1,282 @@
+import argparse
+import bisect
+import importlib
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from array import array
+
+import ABB_AVL
+from Tablas_Hash import ChainingHashTable, OpenAddressingHashTable, RobinHoodHashTable
+from conjuntos_y_mapas import Conjunto, Mapa
+from mapa_ordenado import BPlusTree, OrderedMap
+from RadixSortParaNumerosNegativos import radix_sort
+from MedianaDeDosArreglosOrdenados import findMedianSortedArrays
+
+# El nombre del archivo lleva guion, así que no se puede usar "import" directamente
+RedBlackTree = importlib.import_module("ABB_Rojo-Negro").RedBlackTree
+
+# Adaptador para las funciones del AVL, que reciben y devuelven la raíz
+class _RaizAVL:
+    def __init__(self):
+        self.root = None
+
+    def insert(self, key):
+        self.root = ABB_AVL.insert(self.root, key)
+
+    def search(self, key):
+        return ABB_AVL.search(self.root, key)
+
+    def delete(self, key):
+        self.root = ABB_AVL.delete(self.root, key)
+
+# Estructuras con operaciones por clave: (constructor, insertar, buscar, eliminar)
+STRUCTURES = {
+    "ChainingHashTable": (ChainingHashTable, lambda t, k: t.insert(k, k),
+                          lambda t, k: t.search(k), lambda t, k: t.delete(k)),
+    "OpenAddressingHashTable": (OpenAddressingHashTable, lambda t, k: t.insert(k, k),
+                                lambda t, k: t.search(k), lambda t, k: t.delete(k)),
+    "RobinHoodHashTable": (RobinHoodHashTable, lambda t, k: t.insert(k, k),
+                           lambda t, k: t.search(k), lambda t, k: t.delete(k)),
+    "Conjunto": (Conjunto, lambda c, k: c.insertar(k),
+                 lambda c, k: c.buscar(k), lambda c, k: c.eliminar(k)),
+    "Mapa": (Mapa, lambda m, k: m.insertar(k, k),
+             lambda m, k: m.buscar(k), lambda m, k: m.eliminar(k)),
+    "AVL": (_RaizAVL, lambda t, k: t.insert(k),
+            lambda t, k: t.search(k), lambda t, k: t.delete(k)),
+    "RedBlackTree": (RedBlackTree, lambda t, k: t.insert(k),
+                     lambda t, k: t.search(k), lambda t, k: t.delete(k)),
+    "OrderedMap[avl]": (lambda: OrderedMap("avl"), lambda m, k: m.put(k, k),
+                        lambda m, k: m.get(k), lambda m, k: m.pop(k, None)),
+    "OrderedMap[rb]": (lambda: OrderedMap("rb"), lambda m, k: m.put(k, k),
+                       lambda m, k: m.get(k), lambda m, k: m.pop(k, None)),
+    "BPlusTree": (BPlusTree, lambda m, k: m.put(k, k),
+                  lambda m, k: m.get(k), lambda m, k: m.pop(k, None)),
+}
+
+# Algoritmos que no son estructuras: se miden como una operación sobre todo el lote
+ALGORITHMS = ("radix_sort", "findMedianSortedArrays")
+
+DISTRIBUTIONS = ("uniform", "sorted", "reverse", "zipf", "collisions")
+
+# "collisions" es O(n^2) a propósito en las tablas con encadenamiento: por defecto se
+# limita a este número de claves para que una corrida sin argumentos termine
+COLLISIONS_CAP = 5000
+
+# Genera n claves enteras con la distribución indicada
+def generate_keys(distribution, n, rng):
+    """Devuelve una lista de n claves enteras según la distribución pedida."""
+    if distribution == "uniform":
+        return [rng.randrange(-(1 << 40), 1 << 40) for _ in range(n)]
+    if distribution == "sorted":
+        return sorted(rng.sample(range(n * 10), n))
+    if distribution == "reverse":
+        return sorted(rng.sample(range(n * 10), n), reverse=True)
+    if distribution == "zipf":
+        # Claves repetidas con probabilidad proporcional a 1/rango (s = 1)
+        weights = list(itertools.accumulate(1.0 / r for r in range(1, n + 1)))
+        total = weights[-1]
+        return [bisect.bisect_left(weights, rng.random() * total) for _ in range(n)]
+    if distribution == "collisions":
+        # Múltiplos de 10007 * 2**16: caen en la misma cubeta tanto con módulo primo
+        # (tamaño por defecto de las tablas) como con máscara de potencia de 2
+        keys = [i * 10007 << 16 for i in range(n)]
+        rng.shuffle(keys)
+        return keys
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+# Mide cada llamada por separado para obtener percentiles por operación
+def time_ops(fn, obj, keys):
+    """Ejecuta fn(obj, k) para cada clave y devuelve (tiempo total, latencias en ns)."""
+    clock = time.perf_counter_ns
+    latencies = array('q')
+    start = time.perf_counter()
+    for key in keys:
+        t0 = clock()
+        fn(obj, key)
+        latencies.append(clock() - t0)
+    return time.perf_counter() - start, latencies
+
+# Construye la secuencia de operaciones mixtas para una proporción de lecturas
+def mixed_ops(keys, read_ratio, rng):
+    """Devuelve una lista de ('r'|'i'|'d', clave) con la proporción de lecturas dada."""
+    ops = []
+    fresh = []
+    next_key = -1  # Las claves nuevas son negativas grandes para no chocar con las existentes
+    for _ in range(len(keys)):
+        if rng.random() < read_ratio:
+            ops.append(('r', rng.choice(keys)))
+        elif fresh and rng.random() < 0.5:
+            ops.append(('d', fresh.pop()))
+        else:
+            key = next_key - (1 << 50)
+            next_key -= 1
+            fresh.append(key)
+            ops.append(('i', key))
+    return ops
+
+def percentile(sorted_values, q):
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+def summarize(name, n, distribution, workload, runs, latencies, peak_bytes=None):
+    """Arma el registro JSON de una combinación estructura/tamaño/distribución/carga."""
+    latencies = sorted(latencies)
+    ops = len(latencies) // max(1, len(runs))
+    return {
+        "structure": name,
+        "n": n,
+        "distribution": distribution,
+        "workload": workload,
+        "ops_per_run": ops,
+        "runs_s": runs,
+        "median_s": statistics.median(runs),
+        "p50_ns": percentile(latencies, 0.50),
+        "p99_ns": percentile(latencies, 0.99),
+        "peak_bytes": peak_bytes,
+    }
+
+# Memoria máxima al construir la estructura con todas las claves
+def peak_memory(factory, insert, keys):
+    """Construye la estructura bajo tracemalloc y devuelve el pico en bytes."""
+    tracemalloc.start()
+    obj = factory()
+    for key in keys:
+        insert(obj, key)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del obj
+    return peak
+
+def bench_structure(name, keys, distribution, read_ratios, repeats, warmup, rng):
+    """Mide insert, search, mixed y delete de una estructura sobre las claves dadas."""
+    factory, insert, search, delete = STRUCTURES[name]
+    mixed = {r: mixed_ops(keys, r, rng) for r in read_ratios}
+
+    def run_mixed(obj, op):
+        if op[0] == 'r':
+            search(obj, op[1])
+        elif op[0] == 'i':
+            insert(obj, op[1])
+        else:
+            delete(obj, op[1])
+
+    workloads = ["insert", "search"] + [f"mixed_r{r:g}" for r in read_ratios] + ["delete"]
+    runs = {w: [] for w in workloads}
+    latencies = {w: array('q') for w in workloads}
+    for rep in range(warmup + repeats):
+        obj = factory()
+        measured = [time_ops(insert, obj, keys), time_ops(search, obj, keys)]
+        measured += [time_ops(run_mixed, obj, mixed[r]) for r in read_ratios]
+        measured.append(time_ops(delete, obj, keys))
+        if rep < warmup:
+            continue  # Las rondas de calentamiento no se registran
+        for w, (total, lat) in zip(workloads, measured):
+            runs[w].append(total)
+            latencies[w].extend(lat)
+
+    peak = peak_memory(factory, insert, keys)
+    return [summarize(name, len(keys), distribution, w, runs[w], latencies[w],
+                      peak if w == "insert" else None)
+            for w in workloads]
+
+def bench_algorithm(name, keys, distribution, repeats, warmup):
+    """Mide radix_sort sobre todo el lote o consultas de mediana sobre dos mitades."""
+    if name == "radix_sort":
+        fn, args = (lambda _, data: radix_sort(list(data))), [keys]
+    else:
+        ordered = sorted(keys)
+        halves = (ordered[::2], ordered[1::2])
+        fn, args = (lambda _, pair: findMedianSortedArrays(*pair)), [halves] * 1000
+    runs, latencies = [], array('q')
+    for rep in range(warmup + repeats):
+        total, lat = time_ops(fn, None, args)
+        if rep >= warmup:
+            runs.append(total)
+            latencies.extend(lat)
+    tracemalloc.start()
+    fn(None, args[0])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    workload = "sort" if name == "radix_sort" else "median"
+    return [summarize(name, len(keys), distribution, workload, runs, latencies, peak)]
+
+def compare(results, baseline_path):
+    """Imprime la razón entre las medianas actuales y las de un JSON anterior."""
+    with open(baseline_path) as f:
+        baseline = {(r["structure"], r["n"], r["distribution"], r["workload"]): r
+                    for r in json.load(f)["results"]}
+    print("\nComparison against", baseline_path)
+    for r in results:
+        old = baseline.get((r["structure"], r["n"], r["distribution"], r["workload"]))
+        if old and old["median_s"] > 0:
+            ratio = r["median_s"] / old["median_s"]
+            flag = "  REGRESSION" if ratio > 1.10 else ""
+            print(f"{r['structure']:>24} n={r['n']:<9} {r['distribution']:<10} "
+                  f"{r['workload']:<12} x{ratio:.2f}{flag}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for every structure in the repo")
+    parser.add_argument("--structures", nargs="+", default=list(STRUCTURES) + list(ALGORITHMS),
+                        choices=list(STRUCTURES) + list(ALGORITHMS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000],
+                        help="number of keys (10^3 to 10^7)")
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS),
+                        choices=DISTRIBUTIONS)
+    parser.add_argument("--collisions-cap", type=int, default=COLLISIONS_CAP,
+                        help="max keys for the collisions distribution (0 = no cap)")
+    parser.add_argument("--read-ratios", nargs="+", type=float, default=[0.5, 0.9, 0.99])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="previous JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    results = []
+    for n in args.sizes:
+        for distribution in args.distributions:
+            size = n
+            if distribution == "collisions" and args.collisions_cap:
+                size = min(n, args.collisions_cap)
+            keys = generate_keys(distribution, size, random.Random(args.seed))
+            for name in args.structures:
+                if name in STRUCTURES:
+                    rows = bench_structure(name, keys, distribution, args.read_ratios,
+                                           args.repeats, args.warmup, random.Random(args.seed))
+                else:
+                    rows = bench_algorithm(name, keys, distribution, args.repeats, args.warmup)
+                for r in rows:
+                    if size != n:
+                        r["capped_from"] = n   # Queda registrado en el JSON
+                    peak = f"  peak={r['peak_bytes'] / 1024:.0f}KiB" if r["peak_bytes"] else ""
+                    print(f"{name:>24} n={n:<9} {distribution:<10} {r['workload']:<12} "
+                          f"median={r['median_s']:.4f}s p50={r['p50_ns']}ns "
+                          f"p99={r['p99_ns']}ns{peak}")
+                results.extend(rows)
+
+    report = {
+        "meta": {
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
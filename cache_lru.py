@@ -0,0 +1,179 @@
+import functools
+import sys
+import time
+
+from Tablas_Hash import OpenAddressingHashTable
+
+# Nodo de la lista doblemente enlazada de recencia (intrusiva: la tabla guarda el nodo)
+class _Entry:
+    __slots__ = ("key", "value", "nbytes", "expires", "prev", "next")
+
+    def __init__(self, key=None, value=None, nbytes=0, expires=None):
+        self.key = key
+        self.value = value
+        self.nbytes = nbytes
+        self.expires = expires    # Instante (según clock) en que vence, o None
+        self.prev = self
+        self.next = self
+
+# Cache LRU con límite de entradas y/o bytes y vencimiento (TTL) perezoso
+class LRUCache:
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None, on_evict=None,
+                 sizeof=sys.getsizeof, clock=time.monotonic):
+        """Crea la cache; los límites en None no se aplican."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl                # TTL por defecto en segundos
+        self.on_evict = on_evict      # Llamada como on_evict(clave, valor) al desalojar
+        self.sizeof = sizeof
+        self.clock = clock
+        # La tabla de direccionamiento abierto crece y se encoge sola
+        self._table = OpenAddressingHashTable(size=64)
+        self._head = _Entry()         # Centinela: head.next es el más reciente
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _unlink(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _push_front(self, entry):
+        head = self._head
+        entry.prev = head
+        entry.next = head.next
+        head.next.prev = entry
+        head.next = entry
+
+    def _remove(self, entry):
+        self._unlink(entry)
+        self._table.delete(entry.key)
+        self.bytes -= entry.nbytes
+
+    def _evict(self, entry):
+        self._remove(entry)
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    def get(self, key, default=None):
+        """Devuelve el valor y lo marca como el más reciente; vence entradas al leerlas."""
+        entry = self._table.search(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if entry.expires is not None and entry.expires <= self.clock():
+            self._remove(entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._unlink(entry)
+        self._push_front(entry)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key, value, ttl=None):
+        """Guarda el valor (con TTL propio opcional) y desaloja los menos recientes si hace falta."""
+        ttl = self.ttl if ttl is None else ttl
+        expires = self.clock() + ttl if ttl is not None else None
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        entry = self._table.search(key)
+        if entry is not None:
+            self._unlink(entry)
+            self.bytes -= entry.nbytes
+            entry.value, entry.nbytes, entry.expires = value, nbytes, expires
+        else:
+            entry = _Entry(key, value, nbytes, expires)
+            self._table.insert(key, entry)
+        self._push_front(entry)
+        self.bytes += nbytes
+        # Se desaloja desde el final (el menos reciente), sin tocar la entrada recién puesta
+        tail = self._head.prev
+        while tail is not entry and (
+                (self.max_entries is not None and len(self) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            previous = tail.prev
+            self._evict(tail)
+            tail = previous
+
+    def delete(self, key):
+        """Quita la clave de la cache sin contarla como desalojo."""
+        entry = self._table.search(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def clear(self):
+        self._table = OpenAddressingHashTable(size=64)
+        self._head.prev = self._head.next = self._head
+        self.bytes = 0
+
+    def __contains__(self, key):
+        entry = self._table.search(key)
+        return entry is not None and (entry.expires is None or entry.expires > self.clock())
+
+    def __len__(self):
+        return self._table.count
+
+    def stats(self):
+        """Contadores de aciertos, fallos, desalojos y vencimientos."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "expirations": self.expirations, "entries": len(self), "bytes": self.bytes}
+
+# Convierte listas/diccionarios de los argumentos en tuplas para poder usarlos como clave;
+# cada contenedor lleva su tipo para que [1, 2] y (1, 2), o {1: 2} y {(1, 2)}, no choquen
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        # frozenset y no sorted: las claves pueden ser de tipos que no se comparan
+        return type(value), frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(value)
+    return value
+
+_MARK = object()  # Separa posicionales de nombrados en la clave
+
+def make_key(args, kwargs):
+    """Clave hashable para una llamada con los argumentos dados."""
+    key = tuple(_freeze(arg) for arg in args)
+    if kwargs:
+        key += (_MARK,) + tuple(sorted((k, _freeze(v)) for k, v in kwargs.items()))
+    return key
+
+# Decorador de memoización con LRUCache
+def lru_cache(max_entries=128, max_bytes=None, ttl=None, on_evict=None, key=make_key):
+    """Memoiza una función pura; la cache queda expuesta como func.cache."""
+    def decorator(func):
+        cache = LRUCache(max_entries, max_bytes, ttl, on_evict)
+        missing = object()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(args, kwargs)
+            result = cache.get(k, missing)
+            if result is missing:
+                result = func(*args, **kwargs)
+                cache.put(k, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+if __name__ == "__main__":
+    from MedianaDeDosArreglosOrdenados import findMedianSortedArrays
+    from CaminoDeSumaMaxima import TreeNode, maxPathSum
+
+    median = lru_cache(max_entries=1000)(findMedianSortedArrays)
+    print(median([1, 3, 8], [7, 9, 10, 11]), median([1, 3, 8], [7, 9, 10, 11]))
+    print("Median cache:", median.cache.stats())
+
+    path_sum = lru_cache(max_entries=1000)(maxPathSum)
+    root = TreeNode(10, TreeNode(2, TreeNode(20), TreeNode(1)),
+                    TreeNode(10, None, TreeNode(-25, TreeNode(3), TreeNode(4))))
+    print(path_sum(root), path_sum(root))
+    print("Path sum cache:", path_sum.cache.stats())
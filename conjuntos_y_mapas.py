@@ -1,7 +1,55 @@
-class Conjunto:
+from Tablas_Hash import bucket_plan, chain_stats
+
+# Base común: mantiene el número de entradas y ajusta la capacidad según el factor de carga
+class _TablaRedimensionable:
+    CARGA_MAXIMA = 1.0    # Se duplica la capacidad por encima de este factor de carga
+    CARGA_MINIMA = 0.25   # Se reduce a la mitad por debajo de este factor de carga
+
     def __init__(self, capacidad=100):
         self.capacidad = capacidad
+        self.capacidad_minima = capacidad
+        self.tabla = [[] for _ in range(capacidad)]
+        self.tamano = 0
+        self.redimensionamientos = 0
+
+    def _clave(self, entrada):
+        return entrada
+
+    def _redimensionar(self, capacidad):
+        anterior = self.tabla
+        self.capacidad = capacidad
+        self.redimensionamientos += 1
         self.tabla = [[] for _ in range(capacidad)]
+        for lista in anterior:
+            for entrada in lista:
+                self.tabla[self._hash(self._clave(entrada))].append(entrada)
+
+    # Crece (duplicando) hasta que quepan "extra" entradas más sin superar la carga máxima
+    def _crecer(self, extra=0):
+        capacidad = self.capacidad
+        while self.tamano + extra > capacidad * self.CARGA_MAXIMA:
+            capacidad *= 2
+        if capacidad != self.capacidad:
+            self._redimensionar(capacidad)
+
+    def _encoger(self):
+        capacidad = self.capacidad
+        while capacidad > self.capacidad_minima and self.tamano < capacidad * self.CARGA_MINIMA:
+            capacidad //= 2
+        capacidad = max(capacidad, self.capacidad_minima)
+        if capacidad != self.capacidad:
+            self._redimensionar(capacidad)
+
+    def __len__(self):
+        return self.tamano
+
+    # Estadísticas de colisiones calculadas bajo demanda (no cuestan nada si no se piden)
+    def estadisticas(self):
+        estadisticas = chain_stats(self.tabla)
+        estadisticas["resizes"] = self.redimensionamientos
+        return estadisticas
+
+class Conjunto(_TablaRedimensionable):
 
     def _hash(self, valor):
         return hash(valor) % self.capacidad
@@ -10,47 +58,129 @@ class Conjunto:
         indice = self._hash(valor)
         if valor not in self.tabla[indice]:
             self.tabla[indice].append(valor)
+            self.tamano += 1
+            self._crecer()
 
     def eliminar(self, valor):
         indice = self._hash(valor)
         if valor in self.tabla[indice]:
             self.tabla[indice].remove(valor)
+            self.tamano -= 1
+            self._encoger()
 
     def buscar(self, valor):
         indice = self._hash(valor)
         return valor in self.tabla[indice]
 
-    def union(self, otro):
-        resultado = Conjunto(self.capacidad)
+    def _elementos(self):
         for lista in self.tabla:
-            for elemento in lista:
-                resultado.insertar(elemento)
-        for lista in otro.tabla:
-            for elemento in lista:
-                resultado.insertar(elemento)
+            yield from lista
+
+    def __contains__(self, valor):
+        return self.buscar(valor)
+
+    def __iter__(self):
+        return self._elementos()
+
+    # Agrega un valor que se sabe ausente, sin recorrer su lista
+    def _agregar_nuevo(self, valor):
+        self.tabla[self._hash(valor)].append(valor)
+        self.tamano += 1
+
+    # Conjunto vacío con capacidad para la cardinalidad esperada del resultado
+    def _resultado(self, esperado):
+        resultado = Conjunto(self.capacidad_minima)
+        resultado._crecer(esperado)
+        return resultado
+
+    def union(self, otro):
+        mayor, menor = (self, otro) if self.tamano >= otro.tamano else (otro, self)
+        resultado = self._resultado(self.tamano + otro.tamano)
+        if resultado.capacidad == mayor.capacidad:
+            # Misma capacidad: las listas del mayor se copian tal cual
+            resultado.tabla = [list(lista) for lista in mayor.tabla]
+            resultado.tamano = mayor.tamano
+        else:
+            for elemento in mayor._elementos():
+                resultado._agregar_nuevo(elemento)
+        for elemento in menor._elementos():
+            if not mayor.buscar(elemento):
+                resultado._agregar_nuevo(elemento)
         return resultado
 
     def interseccion(self, otro):
-        resultado = Conjunto(self.capacidad)
-        for lista in self.tabla:
-            for elemento in lista:
-                if otro.buscar(elemento):
-                    resultado.insertar(elemento)
+        # Se recorre el operando más chico y se consulta en el más grande
+        mayor, menor = (self, otro) if self.tamano >= otro.tamano else (otro, self)
+        resultado = self._resultado(menor.tamano)
+        for elemento in menor._elementos():
+            if mayor.buscar(elemento):
+                resultado._agregar_nuevo(elemento)
         return resultado
 
     def diferencia(self, otro):
-        resultado = Conjunto(self.capacidad)
-        for lista in self.tabla:
-            for elemento in lista:
-                if not otro.buscar(elemento):
-                    resultado.insertar(elemento)
+        resultado = self._resultado(self.tamano)
+        for elemento in self._elementos():
+            if not otro.buscar(elemento):
+                resultado._agregar_nuevo(elemento)
         return resultado
 
+    def es_subconjunto(self, otro):
+        if self.tamano > otro.tamano:
+            return False
+        for elemento in self._elementos():
+            if not otro.buscar(elemento):
+                return False
+        return True
+
+    def es_disjunto(self, otro):
+        mayor, menor = (self, otro) if self.tamano >= otro.tamano else (otro, self)
+        for elemento in menor._elementos():
+            if mayor.buscar(elemento):
+                return False
+        return True
+
+    # Operaciones en sitio: modifican self en lugar de construir otro conjunto
+    def __ior__(self, otro):
+        self._crecer(otro.tamano)
+        for elemento in otro._elementos():
+            self.insertar(elemento)
+        return self
+
+    def __iand__(self, otro):
+        if otro.tamano < self.tamano:
+            tabla = [[] for _ in range(self.capacidad)]
+            tamano = 0
+            for elemento in otro._elementos():
+                if self.buscar(elemento):
+                    tabla[self._hash(elemento)].append(elemento)
+                    tamano += 1
+            self.tabla, self.tamano = tabla, tamano
+        else:
+            for lista in self.tabla:
+                lista[:] = [elemento for elemento in lista if otro.buscar(elemento)]
+            self.tamano = sum(len(lista) for lista in self.tabla)
+        self._encoger()
+        return self
+
+    def __isub__(self, otro):
+        if otro.tamano < self.tamano:
+            for elemento in otro._elementos():
+                self.eliminar(elemento)
+        else:
+            for lista in self.tabla:
+                lista[:] = [elemento for elemento in lista if not otro.buscar(elemento)]
+            self.tamano = sum(len(lista) for lista in self.tabla)
+        self._encoger()
+        return self
+
+    __or__ = union
+    __and__ = interseccion
+    __sub__ = diferencia
+
 # Implementación de un Mapa (Dictionary) usando tabla hash abierta con listas de colisiones
-class Mapa:
-    def __init__(self, capacidad=100):
-        self.capacidad = capacidad
-        self.tabla = [[] for _ in range(capacidad)]
+class Mapa(_TablaRedimensionable):
+    def _clave(self, entrada):
+        return entrada[0]
 
     def _hash(self, clave):
         return hash(clave) % self.capacidad
@@ -62,6 +192,8 @@ class Mapa:
                 self.tabla[indice][i] = (clave, valor)
                 return
         self.tabla[indice].append((clave, valor))
+        self.tamano += 1
+        self._crecer()
 
     def buscar(self, clave):
         indice = self._hash(clave)
@@ -78,8 +210,77 @@ class Mapa:
         for i, (k, _) in enumerate(self.tabla[indice]):
             if k == clave:
                 del self.tabla[indice][i]
+                self.tamano -= 1
+                self._encoger()
                 return
 
+    # Operaciones por lotes: los índices se calculan todos antes de tocar la tabla
+    def insertar_varios(self, claves, valores):
+        self._crecer(len(claves))
+        claves, indices, orden = bucket_plan(claves, self.capacidad)
+        valores = list(valores)
+        for p in orden:
+            clave = claves[p]
+            lista = self.tabla[indices[p]]
+            for i, (k, _) in enumerate(lista):
+                if k == clave:
+                    lista[i] = (clave, valores[p])
+                    break
+            else:
+                lista.append((clave, valores[p]))
+                self.tamano += 1
+
+    def buscar_varios(self, claves):
+        claves, indices, orden = bucket_plan(claves, self.capacidad)
+        resultados = [None] * len(claves)
+        for p in orden:
+            clave = claves[p]
+            for k, v in self.tabla[indices[p]]:
+                if k == clave:
+                    resultados[p] = v
+                    break
+        return resultados
+
+    def eliminar_varios(self, claves):
+        claves, indices, orden = bucket_plan(claves, self.capacidad)
+        for p in orden:
+            clave = claves[p]
+            lista = self.tabla[indices[p]]
+            for i, (k, _) in enumerate(lista):
+                if k == clave:
+                    del lista[i]
+                    self.tamano -= 1
+                    break
+        self._encoger()
+
+    # Protocolo de mapeo: m[clave], m[clave] = valor, del m[clave], clave in m, len(m)
+    def __getitem__(self, clave):
+        for k, v in self.tabla[self._hash(clave)]:
+            if k == clave:
+                return v
+        raise KeyError(clave)
+
+    def __setitem__(self, clave, valor):
+        self.insertar(clave, valor)
+
+    def __delitem__(self, clave):
+        tamano = self.tamano
+        self.eliminar(clave)
+        if self.tamano == tamano:
+            raise KeyError(clave)
+
+    def __contains__(self, clave):
+        return any(k == clave for k, _ in self.tabla[self._hash(clave)])
+
+    def __iter__(self):
+        for lista in self.tabla:
+            for k, _ in lista:
+                yield k
+
+    def items(self):
+        for lista in self.tabla:
+            yield from lista
+
 if __name__ == "__main__":
     # Prueba rápida de funcionalidad
     a = Conjunto()
@@ -0,0 +1,221 @@
+import mmap
+import struct
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Sin NumPy las consultas por lotes recorren las claves una a una
+    np = None
+
+# Formato del archivo:
+#   cabecera : magic, número de claves n, typecode de las claves ('q' o 'd')
+#   claves   : n + 1 valores de 8 bytes en orden Eytzinger (la posición 0 no se usa)
+#   rangos   : n + 1 int64; rangos[k] es la posición en orden creciente de la clave k
+#              (rangos[0] = n, el resultado cuando no hay cota inferior)
+MAGIC = b"EYTZNG01"
+_HEADER = struct.Struct("<8sQc7x")
+_NUMPY_TYPES = {'q': "<i8", 'd': "<f8"}
+
+# Posición en orden creciente de cada índice Eytzinger (recorrido in-order del árbol
+# implícito en el que los hijos de k son 2k y 2k + 1)
+def eytzinger_ranks(n):
+    ranks = array('q', bytes(8 * (n + 1)))
+    ranks[0] = n
+    stack = []
+    k, i = 1, 0
+    while stack or k <= n:
+        while k <= n:
+            stack.append(k)
+            k *= 2
+        k = stack.pop()
+        ranks[k] = i
+        i += 1
+        k = 2 * k + 1
+    return ranks
+
+# Índice ordenado inmutable sobre arreglos contiguos en orden Eytzinger (BFS): la
+# búsqueda baja por el árbol implícito sin ramas por comparación y los primeros niveles,
+# los más visitados, quedan juntos al principio del arreglo
+class EytzingerIndex:
+    def __init__(self, keys, ranks, typecode, mapped=None):
+        """Usar from_sorted, from_tree o load."""
+        self.n = len(ranks) - 1
+        self.keys = keys
+        self.ranks = ranks
+        self.typecode = typecode
+        self._mapped = mapped        # (archivo, mmap) si el índice se cargó de disco
+        if np is not None:
+            self._np_keys = np.frombuffer(keys, dtype=_NUMPY_TYPES[typecode])
+            self._np_ranks = np.frombuffer(ranks, dtype="<i8")
+
+    # Construye el índice a partir de claves ya ordenadas (enteros de 64 bits o flotantes)
+    @classmethod
+    def from_sorted(cls, keys):
+        keys = list(keys)
+        typecode = 'q' if all(isinstance(key, int) for key in keys) else 'd'
+        ranks = eytzinger_ranks(len(keys))
+        layout = array(typecode, [0]) * (len(keys) + 1)
+        for k in range(1, len(keys) + 1):
+            layout[k] = keys[ranks[k]]
+        return cls(layout, ranks, typecode)
+
+    # Exporta cualquier árbol que se recorra en orden (AVLTree, RedBlackTree,
+    # CompactRedBlackTree, PersistentAVLTree...)
+    @classmethod
+    def from_tree(cls, tree):
+        return cls.from_sorted(iter(tree))
+
+    def __len__(self):
+        return self.n
+
+    # Índice Eytzinger de la primera clave >= x (> x con inclusive=True), o 0 si no hay
+    def _descend(self, x, inclusive=False):
+        b, n = self.keys, self.n
+        k = 1
+        if inclusive:
+            while k <= n:
+                k = 2 * k + (b[k] <= x)
+        else:
+            while k <= n:
+                k = 2 * k + (b[k] < x)
+        # Se deshacen los pasos a la derecha finales y el último a la izquierda
+        return k >> ((~k & (k + 1)).bit_length())
+
+    def rank(self, x, inclusive=False):
+        """Número de claves < x (o <= x con inclusive=True)."""
+        return self.ranks[self._descend(x, inclusive)]
+
+    def lower_bound(self, x):
+        """Menor clave >= x, o None."""
+        k = self._descend(x)
+        return self.keys[k] if k else None
+
+    def __contains__(self, x):
+        k = self._descend(x)
+        return k != 0 and self.keys[k] == x
+
+    def count_range(self, a, b):
+        """Número de claves en [a, b]."""
+        if a > b:
+            return 0
+        return self.rank(b, inclusive=True) - self.rank(a)
+
+    # Consultas en un tipo común con las claves: así una consulta 1.5 no se trunca a 1
+    # en un índice de enteros
+    def _probes(self, xs):
+        xs = np.asarray(xs)
+        return xs.astype(np.result_type(self._np_keys, xs), copy=False)
+
+    # Versión vectorizada de _descend: todas las consultas bajan un nivel por iteración
+    def _batch_descend(self, xs, inclusive):
+        xs = self._probes(xs)
+        b, n = self._np_keys, self.n
+        k = np.ones(xs.shape, dtype=np.int64)
+        for _ in range(n.bit_length()):
+            inside = k <= n
+            step = (b[np.minimum(k, n)] <= xs) if inclusive else (b[np.minimum(k, n)] < xs)
+            k = np.where(inside, 2 * k + step, k)
+        return k // ((~k & (k + 1)) << 1)
+
+    def batch_rank(self, xs, inclusive=False):
+        """rank() de muchas claves a la vez (arreglo NumPy con NumPy, lista sin él)."""
+        if np is None:
+            return [self.rank(x, inclusive) for x in xs]
+        return self._np_ranks[self._batch_descend(xs, inclusive)]
+
+    def batch_contains(self, xs):
+        """Pertenencia de muchas claves a la vez."""
+        if np is None:
+            return [x in self for x in xs]
+        xs = self._probes(xs)
+        k = self._batch_descend(xs, False)
+        return (k != 0) & (self._np_keys[k] == xs)
+
+    def batch_count_range(self, a, b):
+        """count_range de muchos intervalos [a[i], b[i]] a la vez."""
+        if np is None:
+            return [self.count_range(x, y) for x, y in zip(a, b)]
+        counts = self.batch_rank(b, inclusive=True) - self.batch_rank(a)
+        return np.maximum(counts, 0)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, self.n, self.typecode.encode()))
+            f.write(self.keys)
+            f.write(self.ranks)
+
+    # Abre un índice guardado con mmap: no se lee ni copia nada por adelantado
+    @classmethod
+    def load(cls, path):
+        f = open(path, "rb")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, typecode = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            mm.close()
+            f.close()
+            raise ValueError(f"{path} is not an Eytzinger index")
+        typecode = typecode.decode()
+        width = 8 * (n + 1)
+        view = memoryview(mm)
+        keys = view[_HEADER.size:_HEADER.size + width].cast(typecode)
+        ranks = view[_HEADER.size + width:_HEADER.size + 2 * width].cast('q')
+        return cls(keys, ranks, typecode, mapped=(f, mm, view))
+
+    def close(self):
+        if self._mapped is None:
+            return
+        # Los arreglos que apuntan al mmap se sueltan antes de cerrarlo
+        self._np_keys = self._np_ranks = None
+        self.keys.release()
+        self.ranks.release()
+        f, mm, view = self._mapped
+        view.release()
+        mm.close()
+        f.close()
+        self._mapped = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+if __name__ == "__main__":
+    import importlib
+    import os
+    import random
+    import tempfile
+    import time
+    from ABB_AVL import AVLTree
+
+    RedBlackTree = importlib.import_module("ABB_Rojo-Negro").RedBlackTree
+
+    n = 1000000
+    keys = sorted(random.sample(range(n * 10), n))
+    probes = [random.randrange(n * 10) for _ in range(200000)]
+    avl = AVLTree.from_sorted(keys)
+    rb = RedBlackTree.from_sorted(keys)
+    start = time.perf_counter()
+    index = EytzingerIndex.from_tree(rb)
+    print(f"Export Time: {time.perf_counter() - start:.3f}s")
+
+    for name, lookup in (("AVLTree.search", avl.search), ("RedBlackTree.search", rb.search),
+                         ("EytzingerIndex (scalar)", index.__contains__)):
+        start = time.perf_counter()
+        for x in probes:
+            lookup(x)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>26}: {len(probes) / elapsed / 1e6:.2f}M lookups/s")
+    if np is not None:
+        batch = np.array(probes)
+        start = time.perf_counter()
+        index.batch_contains(batch)
+        elapsed = time.perf_counter() - start
+        print(f"{'EytzingerIndex (batch)':>26}: {len(probes) / elapsed / 1e6:.2f}M lookups/s")
+
+    path = os.path.join(tempfile.mkdtemp(), "indice.eytz")
+    index.save(path)
+    start = time.perf_counter()
+    with EytzingerIndex.load(path) as mapped:
+        print(f"Load Time: {(time.perf_counter() - start) * 1000:.3f}ms, "
+              f"count_range(0, {n}) = {mapped.count_range(0, n)}")
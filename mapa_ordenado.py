@@ -0,0 +1,361 @@
+import importlib
+from bisect import bisect_left, bisect_right
+
+from ABB_AVL import AVLTree
+
+# El nombre del archivo lleva guion, así que no se puede usar "import" directamente
+_rojo_negro = importlib.import_module("ABB_Rojo-Negro")
+RedBlackTree, NIL = _rojo_negro.RedBlackTree, _rojo_negro.NIL
+
+_MISSING = object()
+
+# Mapa ordenado clave -> valor sobre un árbol balanceado: el valor vive en el mismo
+# nodo que la clave, así que no hace falta una tabla hash aparte
+class OrderedMap:
+    def __init__(self, backend="avl"):
+        """backend: "avl" (AVLTree) o "rb" (RedBlackTree)."""
+        if backend == "avl":
+            self._tree, self._nil = AVLTree(), None
+        elif backend == "rb":
+            self._tree, self._nil = RedBlackTree(), NIL
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+
+    def _node(self, key):
+        nil = self._nil
+        node = self._tree.root
+        while node is not nil and node.key != key:
+            node = node.left if key < node.key else node.right
+        return None if node is nil else node
+
+    def put(self, key, value):
+        """Inserta o actualiza el valor de la clave."""
+        node = self._node(key)
+        if node is None:
+            node = self._tree.insert(key)
+        node.value = value
+
+    def get(self, key, default=None):
+        node = self._node(key)
+        return default if node is None else node.value
+
+    def pop(self, key, default=_MISSING):
+        """Elimina la clave y devuelve su valor (KeyError si no existe y no hay default)."""
+        node = self._node(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = node.value
+        if self._nil is None:
+            self._tree.delete(key)
+        else:
+            self._tree.delete_node(node)
+        return value
+
+    def floor(self, key):
+        """Par (clave, valor) con la mayor clave <= key, o None."""
+        nil, best = self._nil, None
+        node = self._tree.root
+        while node is not nil:
+            if node.key <= key:
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return None if best is None else (best.key, best.value)
+
+    def ceiling(self, key):
+        """Par (clave, valor) con la menor clave >= key, o None."""
+        nil, best = self._nil, None
+        node = self._tree.root
+        while node is not nil:
+            if node.key >= key:
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return None if best is None else (best.key, best.value)
+
+    def items(self, a=None, b=None):
+        """Recorre perezosamente los pares con clave en [a, b] (None = sin límite)."""
+        nil = self._nil
+        stack = []
+        node = self._tree.root
+        while node is not nil:
+            if a is None or node.key >= a:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if b is not None and node.key > b:
+                return
+            yield node.key, node.value
+            node = node.right
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+
+    def __len__(self):
+        return len(self._tree)
+
+    def __contains__(self, key):
+        return self._node(key) is not None
+
+    def __getitem__(self, key):
+        node = self._node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+# Nodos del B+-tree: arreglos ordenados anchos en lugar de un nodo por clave
+class _Leaf:
+    __slots__ = ("keys", "values", "next")
+
+    def __init__(self, keys, values, next=None):
+        self.keys = keys
+        self.values = values
+        self.next = next            # Hoja siguiente, para recorrer rangos sin subir
+
+class _Internal:
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys, children):
+        self.keys = keys            # children[i] guarda claves en [keys[i - 1], keys[i])
+        self.children = children
+
+# B+-tree: los pares viven solo en las hojas, encadenadas en orden; la búsqueda dentro
+# de cada nodo es un bisect sobre una lista contigua
+class BPlusTree:
+    def __init__(self, order=64):
+        """order: máximo de claves por nodo (los nodos no raíz guardan al menos order // 2)."""
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order
+        self.min_keys = order // 2
+        self.root = _Leaf([], [])
+        self.count = 0
+
+    def _leaf(self, key):
+        node = self.root
+        while type(node) is _Internal:
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def get(self, key, default=None):
+        leaf = self._leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return default
+
+    def put(self, key, value):
+        """Inserta o actualiza el valor de la clave."""
+        split = self._put(self.root, key, value)
+        if split is not None:  # La raíz se dividió: el árbol crece un nivel
+            self.root = _Internal([split[0]], [self.root, split[1]])
+
+    # Retorna (separador, nodo nuevo) si el nodo se dividió
+    def _put(self, node, key, value):
+        if type(node) is _Leaf:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                node.values[i] = value
+                return None
+            node.keys.insert(i, key)
+            node.values.insert(i, value)
+            self.count += 1
+            if len(node.keys) <= self.order:
+                return None
+            mid = len(node.keys) // 2
+            new = _Leaf(node.keys[mid:], node.values[mid:], node.next)
+            del node.keys[mid:], node.values[mid:]
+            node.next = new
+            return new.keys[0], new
+        i = bisect_right(node.keys, key)
+        split = self._put(node.children[i], key, value)
+        if split is None:
+            return None
+        node.keys.insert(i, split[0])
+        node.children.insert(i + 1, split[1])
+        if len(node.keys) <= self.order:
+            return None
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        new = _Internal(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:], node.children[mid + 1:]
+        return separator, new
+
+    def pop(self, key, default=_MISSING):
+        """Elimina la clave y devuelve su valor (KeyError si no existe y no hay default)."""
+        value = self._pop(self.root, key)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        root = self.root
+        if type(root) is _Internal and not root.keys:
+            self.root = root.children[0]   # La raíz quedó con un solo hijo
+        return value
+
+    def _pop(self, node, key):
+        if type(node) is _Leaf:
+            i = bisect_left(node.keys, key)
+            if i == len(node.keys) or node.keys[i] != key:
+                return _MISSING
+            del node.keys[i]
+            self.count -= 1
+            return node.values.pop(i)
+        i = bisect_right(node.keys, key)
+        child = node.children[i]
+        value = self._pop(child, key)
+        if value is not _MISSING and len(child.keys) < self.min_keys:
+            self._fix_child(node, i)
+        return value
+
+    # Repara un hijo con menos claves que el mínimo: pide una a un hermano o se fusiona
+    def _fix_child(self, parent, i):
+        child = parent.children[i]
+        leaf = type(child) is _Leaf
+        if i > 0 and len(parent.children[i - 1].keys) > self.min_keys:
+            left = parent.children[i - 1]
+            if leaf:
+                child.keys.insert(0, left.keys.pop())
+                child.values.insert(0, left.values.pop())
+                parent.keys[i - 1] = child.keys[0]
+            else:
+                child.keys.insert(0, parent.keys[i - 1])
+                child.children.insert(0, left.children.pop())
+                parent.keys[i - 1] = left.keys.pop()
+            return
+        if i + 1 < len(parent.children) and len(parent.children[i + 1].keys) > self.min_keys:
+            right = parent.children[i + 1]
+            if leaf:
+                child.keys.append(right.keys.pop(0))
+                child.values.append(right.values.pop(0))
+                parent.keys[i] = right.keys[0]
+            else:
+                child.keys.append(parent.keys[i])
+                child.children.append(right.children.pop(0))
+                parent.keys[i] = right.keys.pop(0)
+            return
+        if i > 0:
+            i -= 1                  # Se fusiona con el hermano izquierdo
+        left, right = parent.children[i], parent.children[i + 1]
+        if leaf:
+            left.keys += right.keys
+            left.values += right.values
+            left.next = right.next
+        else:
+            left.keys += [parent.keys[i]] + right.keys
+            left.children += right.children
+        del parent.keys[i], parent.children[i + 1]
+
+    def floor(self, key):
+        """Par (clave, valor) con la mayor clave <= key, o None."""
+        return self._floor(self.root, key)
+
+    def _floor(self, node, key):
+        if type(node) is _Leaf:
+            i = bisect_right(node.keys, key)
+            return (node.keys[i - 1], node.values[i - 1]) if i else None
+        # Si el hijo que corresponde no tiene claves <= key, el piso es el máximo del anterior
+        for c in range(bisect_right(node.keys, key), -1, -1):
+            found = self._floor(node.children[c], key)
+            if found is not None:
+                return found
+        return None
+
+    def ceiling(self, key):
+        """Par (clave, valor) con la menor clave >= key, o None."""
+        leaf = self._leaf(key)
+        i = bisect_left(leaf.keys, key)
+        while leaf is not None and i == len(leaf.keys):
+            leaf, i = leaf.next, 0
+        return None if leaf is None else (leaf.keys[i], leaf.values[i])
+
+    def items(self, a=None, b=None):
+        """Recorre los pares con clave en [a, b] siguiendo los enlaces entre hojas."""
+        if a is None:
+            leaf = self.root
+            while type(leaf) is _Internal:
+                leaf = leaf.children[0]
+            i = 0
+        else:
+            leaf = self._leaf(a)
+            i = bisect_left(leaf.keys, a)
+        while leaf is not None:
+            keys = leaf.keys
+            if b is not None and keys and keys[-1] > b:
+                j = bisect_right(keys, b, i)
+                yield from zip(keys[i:j], leaf.values[i:j])
+                return
+            yield from zip(keys[i:], leaf.values[i:])
+            leaf, i = leaf.next, 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+# Compara las tres variantes: put, get, floor y recorridos de rango
+def benchmark(n=200000, scans=200, span=1000, seed=7):
+    import random
+    import time
+
+    rng = random.Random(seed)
+    keys = rng.sample(range(n * 10), n)
+    probes = [rng.randrange(n * 10) for _ in range(n)]
+    starts = [rng.randrange(n * 10) for _ in range(scans)]
+    variants = (("OrderedMap[avl]", lambda: OrderedMap("avl")),
+                ("OrderedMap[rb]", lambda: OrderedMap("rb")),
+                ("BPlusTree", BPlusTree))
+    for name, make in variants:
+        m = make()
+        start = time.perf_counter()
+        for k in keys:
+            m.put(k, k)
+        put_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for k in probes:
+            m.get(k)
+        get_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for k in probes:
+            m.floor(k)
+        floor_time = time.perf_counter() - start
+        start = time.perf_counter()
+        scanned = sum(1 for a in starts for _ in m.items(a, a + span * 10))
+        scan_time = time.perf_counter() - start
+        print(f"{name:>16} put={put_time:.3f}s get={get_time:.3f}s floor={floor_time:.3f}s "
+              f"scan={scanned / scan_time / 1e6:.2f}M items/s")
+
+if __name__ == "__main__":
+    benchmark()
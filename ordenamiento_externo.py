@@ -0,0 +1,194 @@
+import heapq
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from itertools import islice
+
+from RadixSortParaNumerosNegativos import np, radix_sort, radix_sort_int64
+
+_ITEM = 8  # Bytes por entero de 64 bits
+_PAGE_ITEMS = mmap.PAGESIZE // _ITEM
+
+# Lee la entrada por tramos de a lo sumo chunk_len enteros: archivo binario de int64
+# little-endian o archivo de texto con un entero por línea
+def read_chunks(path, fmt="binary", chunk_len=1 << 20):
+    """Genera array('q') con los enteros de la entrada, un tramo a la vez."""
+    if fmt == "binary":
+        with open(path, "rb") as f:
+            while True:
+                chunk = array('q')
+                try:
+                    chunk.fromfile(f, chunk_len)
+                except EOFError:
+                    pass  # El último tramo viene incompleto; fromfile igual agrega lo leído
+                if not chunk:
+                    return
+                yield chunk
+    elif fmt == "text":
+        with open(path) as f:
+            while True:
+                lines = list(islice(f, chunk_len))
+                if not lines:
+                    return
+                yield array('q', (int(line) for line in lines if line.strip()))
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+
+# Ordena un tramo en memoria con el motor de radix sort (o la versión en Python puro)
+def _sort_chunk(chunk, digit_bits):
+    if np is not None:
+        return radix_sort_int64(np.frombuffer(chunk, dtype="<i8"), digit_bits)
+    return array('q', radix_sort(chunk.tolist()))
+
+# Fase 1: cada tramo ordenado se escribe como un archivo de corrida
+def write_runs(path, fmt, chunk_len, tmpdir, digit_bits=8):
+    """Devuelve las rutas de las corridas ordenadas escritas en tmpdir."""
+    runs = []
+    for chunk in read_chunks(path, fmt, chunk_len):
+        run = os.path.join(tmpdir, f"run_{len(runs):05d}.bin")
+        with open(run, "wb") as f:
+            _sort_chunk(chunk, digit_bits).tofile(f)
+        runs.append(run)
+    return runs
+
+# Abre las corridas con mmap; las vacías no se abren
+def _open_runs(runs):
+    opened = []
+    for run in runs:
+        if os.path.getsize(run):
+            f = open(run, "rb")
+            opened.append((f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)))
+    return opened
+
+# Copia una ventana de buf_len enteros desde la posición pos de la corrida y le avisa al
+# sistema que las páginas ya leídas no se van a volver a usar
+def _window(mm, pos, buf_len):
+    end = min(len(mm) // _ITEM, pos + buf_len)
+    if np is not None:
+        window = np.frombuffer(mm, dtype="<i8", count=end - pos, offset=pos * _ITEM).copy()
+    else:
+        window = array('q', mm[pos * _ITEM:end * _ITEM])
+    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+        mm.madvise(mmap.MADV_DONTNEED, pos * _ITEM, (end - pos) * _ITEM)
+    return window, end
+
+# Fase 2 con NumPy: en cada paso se toma de todas las ventanas lo que es <= que el menor
+# de sus últimos elementos; eso ya está en su lugar definitivo y se ordena junto (timsort
+# funde las k piezas ordenadas en O(m log k))
+def _merge_numpy(opened, buf_len):
+    maps = [mm for _, mm in opened]
+    windows, positions = [], []
+    for mm in maps:
+        window, end = _window(mm, 0, buf_len)
+        windows.append(window)
+        positions.append(end)
+    active = list(range(len(maps)))
+    while active:
+        bound = min(windows[i][-1] for i in active)
+        pieces = []
+        for i in active:
+            cut = int(np.searchsorted(windows[i], bound, side="right"))
+            pieces.append(windows[i][:cut])
+            windows[i] = windows[i][cut:]
+            if not len(windows[i]) and positions[i] < len(maps[i]) // _ITEM:
+                windows[i], positions[i] = _window(maps[i], positions[i], buf_len)
+        active = [i for i in active if len(windows[i])]
+        block = np.concatenate(pieces)
+        block.sort(kind="stable")
+        yield block
+
+# Fase 2 sin NumPy: mezcla k-aria con heapq sobre ventanas de cada corrida
+def _merge_python(opened, buf_len):
+    def values(mm):
+        pos, n = 0, len(mm) // _ITEM
+        while pos < n:
+            window, pos = _window(mm, pos, buf_len)
+            yield from window
+
+    merged = heapq.merge(*(values(mm) for _, mm in opened))
+    while True:
+        block = array('q', islice(merged, buf_len))
+        if not block:
+            return
+        yield block
+
+# Genera los bloques ordenados de la salida y borra las corridas al terminar
+def sorted_blocks(path, fmt="binary", memory_budget=256 << 20, tmpdir=None, digit_bits=8):
+    """Ordena la entrada por bloques sin superar (aproximadamente) memory_budget bytes."""
+    # El tramo en memoria necesita unas 5 veces su tamaño (claves, búfer alterno,
+    # permutación y dígitos); en texto, además, las líneas leídas
+    chunk_len = max(_PAGE_ITEMS, memory_budget // (_ITEM * (5 if fmt == "binary" else 16)))
+    workdir = tempfile.mkdtemp(prefix="radix_runs_", dir=tmpdir)
+    opened = []
+    try:
+        runs = write_runs(path, fmt, chunk_len, workdir, digit_bits)
+        opened = _open_runs(runs)
+        if not opened:
+            return
+        # Las ventanas se llevan un cuarto del presupuesto: la pieza que se ordena en cada
+        # paso y su copia ordenada ocupan a lo sumo otro tanto cada una
+        buf_len = memory_budget // (4 * _ITEM * len(opened))
+        buf_len = max(_PAGE_ITEMS, buf_len - buf_len % _PAGE_ITEMS)
+        merge = _merge_numpy if np is not None else _merge_python
+        yield from merge(opened, buf_len)
+    finally:
+        for f, mm in opened:
+            mm.close()
+            f.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+# Recorre los enteros de los bloques; cerrar este generador cierra sorted_blocks y
+# borra las corridas en el momento, sin esperar al recolector de basura
+def _values(blocks):
+    try:
+        for block in blocks:
+            yield from block.tolist()
+    finally:
+        blocks.close()
+
+# Punto de entrada: ordena un archivo de enteros más grande que la memoria disponible
+def external_radix_sort(path, output=None, fmt="binary", memory_budget=256 << 20,
+                        tmpdir=None, digit_bits=8):
+    """Con output escribe el resultado (en el mismo formato que la entrada) y devuelve el
+    número de enteros; sin output devuelve un iterador sobre los enteros ordenados."""
+    blocks = sorted_blocks(path, fmt, memory_budget, tmpdir, digit_bits)
+    if output is None:
+        return _values(blocks)
+    count = 0
+    try:
+        if fmt == "binary":
+            with open(output, "wb") as f:
+                for block in blocks:
+                    block.tofile(f)
+                    count += len(block)
+        else:
+            with open(output, "w") as f:
+                for block in blocks:
+                    f.write("\n".join(map(str, block.tolist())))
+                    f.write("\n")
+                    count += len(block)
+    finally:
+        blocks.close()
+    return count
+
+if __name__ == "__main__":
+    import random
+    import resource
+    import time
+
+    workdir = tempfile.mkdtemp()
+    source = os.path.join(workdir, "ids.bin")
+    n = 10 ** 7
+    with open(source, "wb") as f:
+        for _ in range(10):
+            if np is not None:
+                np.random.default_rng().integers(-(1 << 62), 1 << 62, n // 10).tofile(f)
+            else:
+                array('q', (random.randint(-(1 << 62), 1 << 62) for _ in range(n // 10))).tofile(f)
+    start = time.perf_counter()
+    count = external_radix_sort(source, os.path.join(workdir, "ids.sorted"), memory_budget=32 << 20)
+    print(f"Sorted {count} int64 ({n * _ITEM / 1e6:.0f}MB) in {time.perf_counter() - start:.2f}s "
+          f"with a 32MB budget, max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f}MB")
+    shutil.rmtree(workdir)
@@ -0,0 +1,174 @@
+import threading
+
+from Tablas_Hash import ChainingHashTable
+
+# Constante de Fibonacci para repartir hashes entre shards (hash multiplicativo)
+_FIB64 = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# Tabla hash concurrente: N shards de ChainingHashTable, cada uno con su propio lock
+class ConcurrentHashTable:
+    def __init__(self, size=10007, shards=16):
+        """Reparte size cubetas entre shards (se redondea a potencia de 2) independientes."""
+        bits = max(0, (shards - 1).bit_length())
+        self.shards = 1 << bits
+        self._shift = 64 - bits
+        # Tamaño impar por shard: las claves de un shard no comparten factores con el tamaño
+        shard_size = max(1, size // self.shards) | 1
+        self._tables = [ChainingHashTable(shard_size) for _ in range(self.shards)]
+        self._locks = [threading.Lock() for _ in range(self.shards)]
+        self._counts = [0] * self.shards
+        # Claves cuyo valor se está calculando: clave -> (hilo que calcula, Event)
+        self._pending = [{} for _ in range(self.shards)]
+
+    def _shard(self, key):
+        """Índice del shard tomado de los bits altos del hash multiplicativo."""
+        if self._shift == 64:
+            return 0
+        return ((hash(key) * _FIB64) & _MASK64) >> self._shift
+
+    # Las lecturas no toman lock: los escritores nunca reordenan una lista de colisiones
+    # en sitio (agregan al final, actualizan el valor del par o reemplazan la lista entera)
+    def search(self, key):
+        """Busca una clave sin bloquear y devuelve su valor, o None si no existe."""
+        return self._tables[self._shard(key)].search(key)
+
+    def __contains__(self, key):
+        table = self._tables[self._shard(key)]
+        return any(pair[0] == key for pair in table.table[table._hash(key)])
+
+    def insert(self, key, value):
+        """Inserta o actualiza un par bajo el lock de su shard."""
+        s = self._shard(key)
+        table = self._tables[s]
+        with self._locks[s]:
+            bucket = table.table[table._hash(key)]
+            for pair in bucket:
+                if pair[0] == key:
+                    pair[1] = value
+                    return
+            bucket.append([key, value])
+            self._counts[s] += 1
+
+    def delete(self, key):
+        """Elimina una clave copiando su lista sin el par (copy-on-write)."""
+        s = self._shard(key)
+        table = self._tables[s]
+        with self._locks[s]:
+            index = table._hash(key)
+            bucket = table.table[index]
+            for i, pair in enumerate(bucket):
+                if pair[0] == key:
+                    # Un lector que esté recorriendo la lista anterior no salta elementos
+                    table.table[index] = bucket[:i] + bucket[i + 1:]
+                    self._counts[s] -= 1
+                    return True
+        return False
+
+    # factory corre fuera del lock (puede llamar a compute_if_absent sobre el mismo shard,
+    # como en una memoización recursiva); los demás hilos que piden la misma clave
+    # esperan a que termine en lugar de calcularla otra vez
+    def compute_if_absent(self, key, factory):
+        """Devuelve el valor de la clave; si no existe, lo calcula una sola vez con factory(key)."""
+        s = self._shard(key)
+        table = self._tables[s]
+        bucket = table.table[table._hash(key)]
+        for pair in bucket:  # Camino rápido sin lock
+            if pair[0] == key:
+                return pair[1]
+        me = threading.get_ident()
+        while True:
+            with self._locks[s]:
+                bucket = table.table[table._hash(key)]
+                for pair in bucket:  # Otro hilo pudo insertarla mientras esperábamos el lock
+                    if pair[0] == key:
+                        return pair[1]
+                pending = self._pending[s].get(key)
+                if pending is None:
+                    done = threading.Event()
+                    self._pending[s][key] = (me, done)
+                    break
+            owner, event = pending
+            if owner == me:
+                raise RuntimeError(f"compute_if_absent({key!r}) called again from its own factory")
+            event.wait()  # Si el otro hilo falló, se vuelve a intentar
+        try:
+            value = factory(key)
+            with self._locks[s]:
+                bucket = table.table[table._hash(key)]
+                bucket.append([key, value])
+                self._counts[s] += 1
+        finally:
+            with self._locks[s]:
+                del self._pending[s][key]
+            done.set()
+        return value
+
+    def get_or_insert(self, key, value):
+        """Devuelve el valor existente o inserta value de forma atómica y lo devuelve."""
+        return self.compute_if_absent(key, lambda _: value)
+
+    def __len__(self):
+        return sum(self._counts)
+
+    def items(self):
+        """Recorre los pares de todos los shards (vista no atómica)."""
+        for table in self._tables:
+            yield from table.items()
+
+# Referencia para el benchmark: una sola tabla protegida por un lock global
+class _GlobalLockTable:
+    def __init__(self):
+        self.table = ChainingHashTable()
+        self.lock = threading.Lock()
+
+    def insert(self, key, value):
+        with self.lock:
+            self.table.insert(key, value)
+
+    def search(self, key):
+        with self.lock:
+            return self.table.search(key)
+
+# Mide operaciones por segundo con un número dado de hilos
+def benchmark_threads(table, keys, threads, ops_per_thread=200000, write_ratio=0.05):
+    """Ejecuta búsquedas (y una fracción de inserciones) desde varios hilos; devuelve ops/s."""
+    import random
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    def worker(seed):
+        rng = random.Random(seed)
+        picks = [rng.choice(keys) for _ in range(ops_per_thread)]
+        writes = set(rng.sample(range(ops_per_thread), int(ops_per_thread * write_ratio)))
+        barrier.wait()
+        for i, key in enumerate(picks):
+            if i in writes:
+                table.insert(key, i)
+            else:
+                table.search(key)
+
+    barrier = threading.Barrier(threads + 1)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(worker, seed) for seed in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+if __name__ == "__main__":
+    import sys
+    from Tablas_Hash import generate_random_key
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled (free-threaded)'}")
+    keys = [generate_random_key() for _ in range(100000)]
+    for name, make in (("Global lock", _GlobalLockTable), ("Sharded", lambda: ConcurrentHashTable(shards=64))):
+        table = make()
+        for i, key in enumerate(keys):
+            table.insert(key, i)
+        for threads in (1, 2, 4, 8, 16):
+            ops = benchmark_threads(table, keys, threads)
+            print(f"{name:>12} threads={threads:<3} {ops / 1e6:.2f}M ops/s")
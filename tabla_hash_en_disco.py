@@ -0,0 +1,192 @@
+import hashlib
+import mmap
+import pickle
+import struct
+
+# Formato del archivo:
+#   cabecera   : magic, número de cubetas, número de entradas
+#   directorio : (cubetas + 1) desplazamientos u64; la cubeta b ocupa [dir[b], dir[b + 1])
+#   heap       : por entrada, hash u64, largo de clave u32, largo de valor u32, clave, valor
+MAGIC = b"THDISK01"
+_HEADER = struct.Struct("<8sQQ")
+_OFFSET = struct.Struct("<Q")
+_ENTRY = struct.Struct("<QII")
+
+_LENGTH = struct.Struct("<I")
+
+# Codifica la clave de forma estable entre procesos (hash() de str cambia en cada ejecución)
+def encode_key(key):
+    """Devuelve los bytes canónicos de la clave, con un byte que indica su tipo."""
+    if key is None:
+        return b"n"
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8")
+    if isinstance(key, bytes):
+        return b"b" + key
+    if isinstance(key, int):  # bool incluido: True == 1 como en un dict
+        return b"i" + int(key).to_bytes((key.bit_length() + 8) // 8, "little", signed=True)
+    if isinstance(key, float) and key.is_integer():
+        return encode_key(int(key))  # 1.0 == 1 también en el archivo
+    if isinstance(key, float):
+        return b"f" + struct.pack("<d", key)
+    # Los elementos se codifican con encode_key, así (1,) y (1.0,) dan los mismos bytes;
+    # los de un frozenset se ordenan por sus bytes para no depender del orden de iteración
+    if isinstance(key, tuple):
+        return b"t" + _encode_items(key)
+    if isinstance(key, frozenset):
+        return b"z" + _encode_items(sorted(encode_key(item) for item in key), encoded=True)
+    raise TypeError(f"Unsupported key type for a frozen table: {type(key).__name__}")
+
+# Concatena los elementos codificados, cada uno precedido por su largo
+def _encode_items(items, encoded=False):
+    parts = []
+    for item in items:
+        item = item if encoded else encode_key(item)
+        parts.append(_LENGTH.pack(len(item)))
+        parts.append(item)
+    return b"".join(parts)
+
+def _decode_items(payload):
+    items, pos = [], 0
+    while pos < len(payload):
+        (length,) = _LENGTH.unpack_from(payload, pos)
+        pos += _LENGTH.size
+        items.append(decode_key(payload[pos:pos + length]))
+        pos += length
+    return items
+
+def decode_key(encoded):
+    """Inversa de encode_key."""
+    tag, payload = encoded[:1], encoded[1:]
+    if tag == b"n":
+        return None
+    if tag == b"s":
+        return payload.decode("utf-8")
+    if tag == b"b":
+        return payload
+    if tag == b"i":
+        return int.from_bytes(payload, "little", signed=True)
+    if tag == b"f":
+        return struct.unpack("<d", payload)[0]
+    if tag == b"t":
+        return tuple(_decode_items(payload))
+    if tag == b"z":
+        return frozenset(_decode_items(payload))
+    raise ValueError(f"Unknown key tag: {tag!r}")
+
+def stable_hash(encoded):
+    """Hash de 64 bits de una clave ya codificada."""
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "little")
+
+# Congela una tabla (cualquier objeto con items()) en un archivo binario
+def freeze(table, path, buckets=None):
+    """Escribe los pares de la tabla en path y devuelve el número de entradas."""
+    records = []
+    for key, value in table.items():
+        encoded = encode_key(key)
+        h = stable_hash(encoded)
+        payload = pickle.dumps(value, protocol=4)
+        records.append((h, _ENTRY.pack(h, len(encoded), len(payload)) + encoded + payload))
+    n_buckets = buckets or max(1, len(records))
+    records.sort(key=lambda record: record[0] % n_buckets)
+
+    heap_start = _HEADER.size + _OFFSET.size * (n_buckets + 1)
+    directory = [0] * (n_buckets + 1)
+    offset = heap_start
+    bucket = 0
+    for h, record in records:
+        b = h % n_buckets
+        while bucket <= b:  # Las cubetas vacías comparten el desplazamiento del siguiente dato
+            directory[bucket] = offset
+            bucket += 1
+        offset += len(record)
+    while bucket <= n_buckets:
+        directory[bucket] = offset
+        bucket += 1
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, n_buckets, len(records)))
+        f.write(struct.pack(f"<{n_buckets + 1}Q", *directory))
+        for _, record in records:
+            f.write(record)
+    return len(records)
+
+# Tabla de solo lectura sobre un archivo mapeado en memoria
+class MappedHashTable:
+    def __init__(self, path):
+        """Abre el archivo con mmap; no se lee ni deserializa nada por adelantado."""
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.buckets, self.count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a frozen hash table")
+
+    def _find(self, key):
+        """Devuelve (inicio, fin) del valor de la clave dentro del mapa, o None."""
+        encoded = encode_key(key)
+        h = stable_hash(encoded)
+        mm = self._mm
+        pos, end = struct.unpack_from("<QQ", mm, _HEADER.size + _OFFSET.size * (h % self.buckets))
+        while pos < end:
+            entry_hash, key_len, value_len = _ENTRY.unpack_from(mm, pos)
+            pos += _ENTRY.size
+            # Se compara primero el hash y el largo; los bytes de la clave solo si coinciden
+            if entry_hash == h and key_len == len(encoded) and mm[pos:pos + key_len] == encoded:
+                return pos + key_len, pos + key_len + value_len
+            pos += key_len + value_len
+        return None
+
+    def search(self, key):
+        """Busca una clave y devuelve su valor si existe, o None si no está."""
+        span = self._find(key)
+        return pickle.loads(self._mm[span[0]:span[1]]) if span else None
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self.count
+
+    def items(self):
+        """Recorre todos los pares (clave, valor) del archivo."""
+        mm = self._mm
+        pos = _HEADER.size + _OFFSET.size * (self.buckets + 1)
+        for _ in range(self.count):
+            _, key_len, value_len = _ENTRY.unpack_from(mm, pos)
+            pos += _ENTRY.size
+            yield decode_key(mm[pos:pos + key_len]), pickle.loads(mm[pos + key_len:pos + key_len + value_len])
+            pos += key_len + value_len
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from Tablas_Hash import ChainingHashTable, generate_random_key
+
+    table = ChainingHashTable()
+    keys = [generate_random_key() for _ in range(100000)]
+    for i, key in enumerate(keys):
+        table.insert(key, i)
+
+    path = os.path.join(tempfile.mkdtemp(), "tabla.bin")
+    start = time.perf_counter()
+    freeze(table, path)
+    print(f"Freeze Time: {time.perf_counter() - start:.4f}s, Size: {os.path.getsize(path) / 1e6:.1f}MB")
+
+    start = time.perf_counter()
+    with MappedHashTable(path) as mapped:
+        open_time = time.perf_counter() - start
+        start = time.perf_counter()
+        found = sum(1 for key in keys if mapped.search(key) is not None)
+        print(f"Open Time: {open_time * 1000:.3f}ms, Search Time: {time.perf_counter() - start:.4f}s, Found: {found}")
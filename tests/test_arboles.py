@@ -0,0 +1,170 @@
+import importlib
+import random
+from collections import Counter
+
+import pytest
+
+import ABB_AVL
+from ABB_AVL import AVLTree
+
+RedBlackTree = importlib.import_module("ABB_Rojo-Negro").RedBlackTree
+
+TREES = [AVLTree, RedBlackTree]
+OPS = {
+    "union": lambda a, b: a | b,
+    "intersection": lambda a, b: a & b,
+    "difference": lambda a, b: a - b,
+}
+
+
+def _tree(cls, keys, sums=False):
+    tree = cls(sums=sums, multiset=True)
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+@pytest.mark.parametrize("cls", TREES)
+@pytest.mark.parametrize("op", OPS)
+def test_multiset_ops_follow_counter(cls, op):
+    rng = random.Random(19)
+    for _ in range(50):
+        a = [rng.randrange(12) for _ in range(rng.randrange(25))]
+        b = [rng.randrange(12) for _ in range(rng.randrange(25))]
+        result = getattr(_tree(cls, a, sums=True), op)(_tree(cls, b, sums=True))
+        expected = sorted(OPS[op](Counter(a), Counter(b)).elements())
+        assert list(result) == expected
+        assert len(result) == len(expected)
+        assert result.sum_range(0, 11) == sum(expected)
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_multiset_examples(cls):
+    assert list(_tree(cls, [1]).union(_tree(cls, [1, 1, 1]))) == [1, 1, 1]
+    assert list(_tree(cls, [1, 1, 1]).intersection(_tree(cls, [1, 1]))) == [1, 1]
+    assert list(_tree(cls, [1, 1, 2]).difference(_tree(cls, [1]))) == [1, 2]
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_plain_set_ops_unchanged(cls):
+    a, b = cls.from_sorted([1, 2, 3, 4]), cls.from_sorted([3, 4, 5])
+    assert list(a.union(b)) == [1, 2, 3, 4, 5]
+    a, b = cls.from_sorted([1, 2, 3, 4]), cls.from_sorted([3, 4, 5])
+    assert list(a.intersection(b)) == [3, 4]
+    a, b = cls.from_sorted([1, 2, 3, 4]), cls.from_sorted([3, 4, 5])
+    assert list(a.difference(b)) == [1, 2]
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_mixed_modes_are_rejected(cls):
+    with pytest.raises(ValueError):
+        cls.from_sorted([1]).union(cls.from_sorted([1], multiset=True))
+
+
+@pytest.mark.parametrize("op", [ABB_AVL.union, ABB_AVL.intersection, ABB_AVL.difference])
+def test_parallel_multiset_ops(op):
+    rng = random.Random(7)
+    a = [rng.randrange(50) for _ in range(400)]
+    b = [rng.randrange(50) for _ in range(400)]
+    root = ABB_AVL.parallel_set_op(op, ABB_AVL.from_sorted(a, multiset=True),
+                                   ABB_AVL.from_sorted(b, multiset=True),
+                                   workers=2, depth=2, min_size=0, multiset=True)
+    name = op.__name__
+    assert ABB_AVL.inorder(root) == sorted(OPS[name](Counter(a), Counter(b)).elements())
+
+
+def _check_red_black(tree):
+    NIL = tree.NIL
+
+    def walk(node, lo, hi):
+        if node is NIL:
+            return 1
+        assert lo is None or node.key >= lo
+        assert hi is None or node.key <= hi
+        for child in (node.left, node.right):
+            if child is not NIL:
+                assert child.parent is node
+                assert not (node.color == "RED" and child.color == "RED")
+        assert node.size == node.left.size + node.right.size + node.count
+        lh = walk(node.left, lo, node.key)
+        assert lh == walk(node.right, node.key, hi)
+        return lh + (node.color == "BLACK")
+
+    assert tree.root.color == "BLACK"
+    walk(tree.root, None, None)
+
+
+def test_red_black_operations_never_write_the_shared_sentinel():
+    module = importlib.import_module("ABB_Rojo-Negro")
+    NIL = module.NIL
+    marker = module.RBNode(key=None, color="BLACK", size=0)
+    rng = random.Random(15)
+    keys = rng.sample(range(10000), 2000)
+    NIL.parent = marker             # Cualquier escritura en NIL.parent lo pisaría
+    try:
+        tree = RedBlackTree.from_sorted(keys)
+        for key in keys[:1500]:
+            tree.delete(key)
+        _check_red_black(tree)
+        left, right = RedBlackTree.from_sorted(keys).split(5000)
+        _check_red_black(RedBlackTree.join(left, right))
+        a, b = RedBlackTree.from_sorted(keys[:1200]), RedBlackTree.from_sorted(keys[800:])
+        _check_red_black(a.difference(b))
+        assert NIL.parent is marker
+        assert NIL.left is NIL and NIL.right is NIL and NIL.color == "BLACK"
+    finally:
+        NIL.parent = NIL
+
+
+def test_red_black_deletes_in_parallel_threads():
+    import threading
+
+    rng = random.Random(16)
+    keys = rng.sample(range(10000), 3000)
+    trees = [RedBlackTree.from_sorted(keys) for _ in range(4)]
+
+    def churn(tree, seed):
+        order = keys[:]
+        random.Random(seed).shuffle(order)
+        for key in order[:2000]:
+            tree.delete(key)
+        for key in order[:500]:
+            tree.insert(key)
+
+    threads = [threading.Thread(target=churn, args=(t, i)) for i, t in enumerate(trees)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for tree in trees:
+        _check_red_black(tree)
+        assert len(tree) == 1500
+
+
+def test_compact_tree_rejected_key_keeps_free_slots():
+    CompactRedBlackTree = importlib.import_module("ABB_Rojo-Negro").CompactRedBlackTree
+    tree = CompactRedBlackTree('q')
+    for key in range(10):
+        tree.insert(key)
+    for key in range(3):
+        tree.delete(key)
+    free, slots = tree.free, len(tree.keys)
+    with pytest.raises(TypeError):
+        tree.insert(1.5)
+    assert tree.free == free and len(tree.keys) == slots and len(tree) == 7
+    for key in (20, 21, 22):
+        tree.insert(key)
+    assert len(tree.keys) == slots  # Se reutilizaron los tres espacios libres
+    assert tree.free == 0
+    assert tree.inorder() == [3, 4, 5, 6, 7, 8, 9, 20, 21, 22]
+
+
+def test_compact_tree_incomparable_key_leaves_tree_intact():
+    CompactRedBlackTree = importlib.import_module("ABB_Rojo-Negro").CompactRedBlackTree
+    tree = CompactRedBlackTree(None)
+    for key in (5, 1, 9):
+        tree.insert(key)
+    with pytest.raises(TypeError):
+        tree.insert("x")
+    assert len(tree) == 3 and len(tree.keys) == 4
+    assert tree.inorder() == [1, 5, 9]
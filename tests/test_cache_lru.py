@@ -0,0 +1,92 @@
+from cache_lru import LRUCache, lru_cache, make_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1      # "b" pasa a ser el menos reciente
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_put_refreshes_recency():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+    cache.put("c", 3)
+    assert cache.get("a") == 10 and "b" not in cache
+
+
+def test_on_evict_callback():
+    evicted = []
+    cache = LRUCache(max_entries=1, on_evict=lambda k, v: evicted.append((k, v)))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.delete("b")               # Borrar no cuenta como desalojo
+    assert evicted == [("a", 1)]
+
+
+def test_max_bytes_evicts_until_under_limit():
+    cache = LRUCache(max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    cache.put("c", "xxxxxx")
+    assert "a" not in cache and "b" in cache and "c" in cache
+    assert cache.bytes == 10
+
+
+def test_ttl_expires_lazily():
+    clock = FakeClock()
+    cache = LRUCache(ttl=5, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=20)
+    clock.now = 6
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats()["expirations"] == 1
+    clock.now = 21
+    assert cache.get("b", "gone") == "gone"
+
+
+def test_dict_argument_with_mixed_key_types():
+    calls = []
+
+    @lru_cache()
+    def g(d):
+        calls.append(d)
+        return len(d)
+
+    assert g({'a': 1, 2: 3}) == 2
+    assert g({2: 3, 'a': 1}) == 2
+    assert len(calls) == 1
+
+
+def test_make_key_ignores_kwargs_order():
+    assert make_key((1,), {'x': 1, 'y': [2]}) == make_key((1,), {'y': [2], 'x': 1})
+    assert make_key(({'a': 1, 2: [3]},), {}) != make_key(({'a': 1, 2: [4]},), {})
+
+
+def test_containers_of_different_types_do_not_collide():
+    @lru_cache()
+    def kind(value):
+        return type(value).__name__
+
+    assert kind([1, 2]) == "list"
+    assert kind((1, 2)) == "tuple"
+    assert kind({1: 2}) == "dict"
+    assert kind({(1, 2)}) == "set"
+    assert kind(frozenset({(1, 2)})) == "frozenset"
+    assert make_key(([1, [2]],), {}) != make_key(([1, (2,)],), {})
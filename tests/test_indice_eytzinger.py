@@ -0,0 +1,20 @@
+from indice_eytzinger import EytzingerIndex
+
+
+def test_batch_matches_scalar_on_non_integral_probes():
+    index = EytzingerIndex.from_sorted([1, 2, 3, 5, 8])
+    probes = [-1, 0.5, 1, 1.5, 2.5, 3, 4.9, 5.0, 7.5, 8, 8.5]
+    assert list(index.batch_contains(probes)) == [x in index for x in probes]
+    for inclusive in (False, True):
+        assert list(index.batch_rank(probes, inclusive)) == \
+            [index.rank(x, inclusive) for x in probes]
+    lows, highs = [1.5, 0.5, 2.5, 5], [3, 8.5, 2.9, 4.5]
+    assert list(index.batch_count_range(lows, highs)) == \
+        [index.count_range(a, b) for a, b in zip(lows, highs)]
+
+
+def test_batch_on_float_index():
+    index = EytzingerIndex.from_sorted([-2.5, 0.0, 1.25, 3.0])
+    probes = [-3, -2.5, 0, 1, 1.25, 4]
+    assert list(index.batch_contains(probes)) == [x in index for x in probes]
+    assert list(index.batch_rank(probes)) == [index.rank(x) for x in probes]
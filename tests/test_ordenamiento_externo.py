@@ -0,0 +1,50 @@
+import random
+from array import array
+from itertools import islice
+
+import ordenamiento_externo
+from ordenamiento_externo import external_radix_sort
+
+
+def _write_input(path, n, seed=23):
+    rng = random.Random(seed)
+    values = [rng.randint(-(1 << 62), 1 << 62) for _ in range(n)]
+    with open(path, "wb") as f:
+        array('q', values).tofile(f)
+    return values
+
+
+def test_sorts_across_several_runs(tmp_path):
+    values = _write_input(tmp_path / "in.bin", 5000)
+    spill = tmp_path / "spill"
+    spill.mkdir()
+    out = tmp_path / "out.bin"
+    assert external_radix_sort(tmp_path / "in.bin", out, memory_budget=1 << 14,
+                               tmpdir=spill) == len(values)
+    result = array('q')
+    with open(out, "rb") as f:
+        result.frombytes(f.read())
+    assert result.tolist() == sorted(values)
+    assert list(spill.iterdir()) == []
+
+
+def test_close_removes_spill_files(tmp_path):
+    values = _write_input(tmp_path / "in.bin", 5000)
+    spill = tmp_path / "spill"
+    spill.mkdir()
+    it = external_radix_sort(tmp_path / "in.bin", memory_budget=1 << 14, tmpdir=spill)
+    assert list(islice(it, 100)) == sorted(values)[:100]
+    assert list(spill.iterdir())    # Las corridas siguen mientras se lee
+    it.close()
+    assert list(spill.iterdir()) == []
+
+
+def test_close_without_numpy(tmp_path, monkeypatch):
+    monkeypatch.setattr(ordenamiento_externo, "np", None)
+    values = _write_input(tmp_path / "in.bin", 3000)
+    spill = tmp_path / "spill"
+    spill.mkdir()
+    it = external_radix_sort(tmp_path / "in.bin", memory_budget=1 << 14, tmpdir=spill)
+    assert next(it) == min(values)
+    it.close()
+    assert list(spill.iterdir()) == []
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+import RadixSortParaNumerosNegativos as radix
+
+
+def test_sorts_ints_with_and_without_numpy(monkeypatch):
+    data = [170, -45, 75, -90, 802, 24, 2, 66, -123, 1 << 70, -(1 << 65)]
+    assert radix.radix_sort(data) == sorted(data)
+    monkeypatch.setattr(radix, "np", None)
+    assert radix.radix_sort(data) == sorted(data)
+
+
+def test_sorts_integer_arrays():
+    data = np.array([5, -3, 0, 7], dtype=np.int32)
+    assert radix.radix_sort(data) == [-3, 0, 5, 7]
+    big = np.array([1 << 63, 3, 1], dtype=np.uint64)
+    assert radix.radix_sort(big) == [1, 3, 1 << 63]
+
+
+@pytest.mark.parametrize("data", [[1.5, 0.2, -0.7], ["3", "1"], [1, 2.5],
+                                  np.array([1.5, 0.2])])
+def test_non_integers_are_not_coerced(data):
+    with pytest.raises(TypeError):
+        radix.radix_sort(data)
+
+
+def test_float_keys_use_float_engine():
+    assert radix.sort_keys([2.0, -1.5, 0.25]) == [-1.5, 0.25, 2.0]
+    assert radix.radix_sort_float64([0.0, -0.0, -2.0]).tolist() == [-2.0, -0.0, 0.0]
@@ -0,0 +1,62 @@
+import threading
+import time
+
+import pytest
+
+from tabla_hash_concurrente import ConcurrentHashTable
+
+
+def test_nested_compute_on_same_shard_does_not_deadlock():
+    table = ConcurrentHashTable(shards=1)
+
+    def fib(n):
+        return n if n < 2 else table.compute_if_absent(n - 1, fib) + table.compute_if_absent(n - 2, fib)
+
+    result = []
+    worker = threading.Thread(target=lambda: result.append(table.compute_if_absent(30, fib)),
+                              daemon=True)
+    worker.start()
+    worker.join(timeout=10)
+    assert not worker.is_alive(), "compute_if_absent deadlocked"
+    assert result == [832040]
+    assert len(table) == 31
+
+
+def test_factory_runs_once_under_contention():
+    table = ConcurrentHashTable(shards=2)
+    calls = []
+
+    def slow(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return key * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(table.compute_if_absent(7, slow)))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == [7]
+    assert results == [14] * 8
+    assert len(table) == 1
+
+
+def test_failed_factory_leaves_no_entry():
+    table = ConcurrentHashTable(shards=1)
+
+    def boom(key):
+        raise ValueError(key)
+
+    with pytest.raises(ValueError):
+        table.compute_if_absent("k", boom)
+    assert "k" not in table
+    assert table.compute_if_absent("k", lambda key: 1) == 1
+
+
+def test_recursive_compute_of_same_key_raises():
+    table = ConcurrentHashTable(shards=1)
+    with pytest.raises(RuntimeError):
+        table.compute_if_absent("k", lambda key: table.compute_if_absent(key, len))
+    assert "k" not in table
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tabla_hash_en_disco import MappedHashTable, decode_key, encode_key, freeze
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("key", [None, "clave", b"\x00raw", 0, -1, 1 << 80, 2.5, (),
+                                 (1, "a", (2.5, None)), frozenset({"alpha", "beta", 3})])
+def test_round_trip(key):
+    assert decode_key(encode_key(key)) == key
+
+
+def test_equal_keys_encode_equal():
+    assert encode_key((1,)) == encode_key((1.0,)) == encode_key((True,))
+    assert encode_key(frozenset({1, "a"})) == encode_key(frozenset({"a", 1.0}))
+
+
+def test_encoding_does_not_depend_on_hash_seed():
+    code = ("from tabla_hash_en_disco import encode_key;"
+            "print(encode_key(frozenset('alpha beta gamma delta epsilon'.split())).hex())")
+    outputs = set()
+    for seed in ("1", "2", "3"):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=ROOT)
+        outputs.add(subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                                   capture_output=True, text=True).stdout)
+    assert len(outputs) == 1
+
+
+def test_unsupported_keys_are_rejected():
+    with pytest.raises(TypeError):
+        encode_key(object())
+    with pytest.raises(TypeError):
+        encode_key((1, object()))
+
+
+def test_frozen_table_finds_composite_keys(tmp_path):
+    table = {(1, "x"): "a", frozenset({"p", "q"}): "b", None: "c"}
+    path = tmp_path / "tabla.bin"
+    freeze(table, path)
+    with MappedHashTable(path) as mapped:
+        assert mapped.search((1.0, "x")) == "a"
+        assert mapped.search(frozenset({"q", "p"})) == "b"
+        assert mapped.search(None) == "c"
+        assert dict(mapped.items()) == table